@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
@@ -27,6 +28,10 @@ def _coerce_float(value):
         return None
 
 
+# Feet and inches around exactly one separator: 6-2, 5'10, 6’1, 6′0.
+HEIGHT_RE = re.compile(r"(\d+)[-’'′](\d+)")
+
+
 def _height_to_inches(raw: str | float | None) -> int | None:
     """Convert heights like '6-2' or '5-10' to total inches."""
     if raw is None or pd.isna(raw):
@@ -34,12 +39,9 @@ def _height_to_inches(raw: str | float | None) -> int | None:
     text = str(raw).strip()
     if not text:
         return None
-    for sep in ("-", "’", "'", "′"):
-        if sep in text:
-            parts = text.split(sep)
-            if len(parts) == 2 and all(p.isdigit() for p in parts):
-                feet, inches = map(int, parts)
-                return feet * 12 + inches
+    m = HEIGHT_RE.fullmatch(text)
+    if m:
+        return int(m.group(1)) * 12 + int(m.group(2))
     if text.isdigit():
         # Already an inch value
         return int(text)
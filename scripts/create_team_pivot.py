@@ -5,12 +5,18 @@
 
 import argparse
 import csv
+import gzip
 import re
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Set
 
+import numpy as np
 import pandas as pd
 
 from scripts.helpers.teams_loader import load_teams
@@ -31,7 +37,6 @@ from scripts.helpers.rpi_lookup import build_rpi_lookup
 logger = get_logger(__name__)
 
 EXPORT_DIR = "exports"
-os.makedirs(EXPORT_DIR, exist_ok=True)
 
 INPUT_CSV = os.path.join(EXPORT_DIR, "ncaa_wvb_merged_2025.csv")
 OUTPUT_CSV = os.path.join(EXPORT_DIR, "team_pivot.csv")
@@ -91,6 +96,27 @@ def parse_incoming_players() -> List[Dict[str, str]]:
     return players
 
 
+@dataclass(slots=True, eq=False)
+class RosterPlayer:
+    """Per-player record used while building one team's pivot row."""
+    name: str
+    position_raw: str
+    pos_codes: Set[str]
+    is_setter: bool
+    is_pin: bool
+    is_middle: bool
+    is_def: bool
+    class_norm: str
+    class_next: str
+    is_graduating: bool
+    is_outgoing_transfer: bool
+    height: str
+    height_in: float
+    assists: int
+    kills: int
+    digs: int
+
+
 def height_to_inches(height_str: str) -> float:
     """Convert '6-2' to inches (74.0)."""
     if not height_str or height_str == "":
@@ -118,12 +144,13 @@ def inches_to_height(inches: float) -> str:
     return f"{feet}' {rem}\""
 
 
-def to_int_safe(val: Any) -> int:
-    """Safely convert to int, return 0 if fails."""
-    try:
-        return int(float(val))
-    except:
-        return 0
+def to_int_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """Column as int64: numeric values truncated toward zero; missing, non-numeric or infinite -> 0."""
+    if col not in df.columns:
+        return pd.Series(0, index=df.index, dtype="int64")
+    vals = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype="float64")
+    vals = np.where(np.isfinite(vals), vals, 0.0)
+    return pd.Series(np.trunc(vals).astype("int64"), index=df.index)
 
 
 def _get_cached_rpi_lookup() -> Dict[str, Dict[str, str]]:
@@ -153,7 +180,7 @@ def _get_cached_rpi_lookup() -> Dict[str, Dict[str, str]]:
     return lookup
 
 
-def main(input_csv=None, output_csv=None, teams_json_path=None):
+def main(input_csv=None, output_csv=None, teams_json_path=None, gzip_output=False):
     """
     Generate team pivot CSV from scraper output.
     
@@ -161,65 +188,81 @@ def main(input_csv=None, output_csv=None, teams_json_path=None):
         input_csv: Input CSV file with per-player data
         output_csv: Output CSV file for team-level data
         teams_json_path: Optional custom path to teams.json (default uses loader default)
+        gzip_output: Write gzip-compressed CSV (".gz" appended to output_csv)
     """
-    input_csv = input_csv or INPUT_CSV
-    output_csv = output_csv or OUTPUT_CSV
-    teams_data = load_teams(teams_json_path)
-    team_meta_lookup = {
-        normalize_school_key(t.get("team", "")): t for t in teams_data
-    }
-    team_coach_lookup = {
-        k: v.get("coaches", []) or [] for k, v in team_meta_lookup.items()
-    }
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+
+    # Start the RPI lookup (network or cache) in the background; it is
+    # independent of the CSV load and lookup building below, and is only
+    # needed once the team loop starts.
+    logger.info("Fetching RPI data...")
+    # The executor is scoped to the code that needs the result: the fetch
+    # thread is joined here whether the work below succeeds or raises, and
+    # a fetch error surfaces from rpi_future.result().
+    with ThreadPoolExecutor(max_workers=1) as rpi_executor:
+        rpi_future = rpi_executor.submit(_get_cached_rpi_lookup)
+
+        input_csv = input_csv or INPUT_CSV
+        output_csv = output_csv or OUTPUT_CSV
+        teams_data = load_teams(teams_json_path)
+        team_meta_lookup = {
+            normalize_school_key(t.get("team", "")): t for t in teams_data
+        }
+        team_coach_lookup = {
+            k: v.get("coaches", []) or [] for k, v in team_meta_lookup.items()
+        }
     
-    logger.info("Reading simplified scraper output: %s", input_csv)
+        logger.info("Reading simplified scraper output: %s", input_csv)
     
-    # Read the simplified CSV
-    df = pd.read_csv(input_csv)
+        # Read the simplified CSV
+        df = pd.read_csv(input_csv)
     
-    # Normalize column names for merged NCAA file
-    df = df.rename(
-        columns={
-            "School": "team",       # primary team field
-            "Team": "stats_team",   # display name from stats
-            "Conference": "conference",
-            "Player": "name",
-            "Yr": "class",
-            "Pos": "position",
-            "Ht": "height",
-            "Hit Pct": "hitting_pct",
-            "Assists": "assists",
-            "Digs": "digs",
-            "Kills": "kills",
-            "PTS": "points",
-        }
-    )
-    # Default values if missing
-    if "team" not in df.columns and "stats_team" in df.columns:
-        df["team"] = df["stats_team"]
+        # Normalize column names for merged NCAA file
+        df = df.rename(
+            columns={
+                "School": "team",       # primary team field
+                "Team": "stats_team",   # display name from stats
+                "Conference": "conference",
+                "Player": "name",
+                "Yr": "class",
+                "Pos": "position",
+                "Ht": "height",
+                "Hit Pct": "hitting_pct",
+                "Assists": "assists",
+                "Digs": "digs",
+                "Kills": "kills",
+                "PTS": "points",
+            }
+        )
+        # Default values if missing
+        if "team" not in df.columns and "stats_team" in df.columns:
+            df["team"] = df["stats_team"]
+
+        # Coerce stat columns once, vectorized, instead of per player in the team loop
+        for stat_col in ("assists", "kills", "digs"):
+            df[stat_col] = to_int_column(df, stat_col)
     
-    # Build lookup of existing players (for transfers class/pos lookup)
-    player_lookup = {}
-    for _, row in df.iterrows():
-        key = normalize_player_name(str(row.get("name", "")))
-        if not key:
-            continue
-        pos_codes = extract_position_codes(str(row.get("position", "")))
-        class_norm = normalize_class(str(row.get("class", "")))
-        player_lookup[key] = {
-            "position_raw": str(row.get("position", "")),
-            "pos_codes": pos_codes,
-            "class_norm": class_norm,
-            "class_next": class_next_year(class_norm),
-        }
+        # Build lookup of existing players (for transfers class/pos lookup)
+        player_lookup = {}
+        for _, row in df.iterrows():
+            key = normalize_player_name(str(row.get("name", "")))
+            if not key:
+                continue
+            pos_codes = extract_position_codes(str(row.get("position", "")))
+            class_norm = normalize_class(str(row.get("class", "")))
+            player_lookup[key] = {
+                "position_raw": str(row.get("position", "")),
+                "pos_codes": pos_codes,
+                "class_norm": class_norm,
+                "class_next": class_next_year(class_norm),
+            }
 
-    # Parse incoming players
-    logger.info("Parsing incoming players...")
-    incoming_players = parse_incoming_players()
+        # Parse incoming players
+        logger.info("Parsing incoming players...")
+        incoming_players = parse_incoming_players()
     
-    # Build RPI lookup (with cache fallback)
-    logger.info("Fetching RPI data...")
-    rpi_lookup = _get_cached_rpi_lookup()
+        # Collect RPI lookup (with cache fallback) started above
+        rpi_lookup = rpi_future.result()
     if rpi_lookup:
         logger.info(f"Loaded RPI data for {len(rpi_lookup)} teams")
     else:
@@ -240,286 +283,318 @@ def main(input_csv=None, output_csv=None, teams_json_path=None):
         if new_team_key not in incoming_by_team:
             incoming_by_team[new_team_key] = []
         incoming_by_team[new_team_key].append(xfer)
+
+    # Precompute per-team lookups once instead of re-normalizing inside the
+    # per-player / per-team loops below.
+    outgoing_names_by_team = {
+        team_key: {normalize_player_name(x["name"]) for x in xfers}
+        for team_key, xfers in outgoing_by_team.items()
+    }
+    incoming_players_by_team: Dict[str, List[Dict[str, Any]]] = {}
+    for p in incoming_players:
+        incoming_players_by_team.setdefault(normalize_school_key(p["school"]), []).append(p)
     
-    # Process each team
-    results = []
+    # Process each team, streaming rows to a temp file as they are built so
+    # the full table is never held in memory. Every row carries the same keys,
+    # so the header comes from the first one. The temp file replaces the
+    # previous output only once the run completes.
+    if gzip_output and not output_csv.endswith(".gz"):
+        output_csv = f"{output_csv}.gz"
+    logger.info("Writing team pivot to: %s", output_csv)
+    tmp_csv = f"{output_csv}.tmp"
+    # compresslevel=3 keeps CPU cost small while still shrinking the file
+    # several-fold; the text wrapper feeds the compressor buffered chunks.
+    open_output = partial(gzip.open, compresslevel=3) if gzip_output else open
+    row_count = 0
+    writer = None
+    get_cols = None
     
-    for team_name, team_df in df.groupby("team"):
-        logger.info("Processing team: %s", team_name)
-        team_key = normalize_school_key(team_name)
-        team_info = team_meta_lookup.get(team_key, {})
+    try:
+        with open_output(tmp_csv, "wt", newline="", encoding="utf-8") as f:
+            for team_name, team_df in df.groupby("team"):
+                logger.info("Processing team: %s", team_name)
+                team_key = normalize_school_key(team_name)
+                team_info = team_meta_lookup.get(team_key, {})
         
-        # Get team metadata
-        conference = team_df["conference"].iloc[0] if "conference" in team_df.columns else ""
+                # Get team metadata
+                conference = team_df["conference"].iloc[0] if "conference" in team_df.columns else ""
         
-        # Get RPI rank and record from RPI lookup using canonical team names
-        stats_team_name = team_df["stats_team"].iloc[0] if "stats_team" in team_df.columns else team_name
-        stats_team_canonical = resolve_canonical_team_name(stats_team_name)
-        if not stats_team_canonical:
-            stats_team_canonical = resolve_canonical_team_name(team_name)
-        if not stats_team_canonical:
-            stats_team_canonical = team_name
-        stats_team_key = normalize_school_key(stats_team_canonical)
-        rpi_data = rpi_lookup.get(stats_team_key, {}) or rpi_lookup.get(team_key, {})
-        rank = rpi_data.get("rpi_rank", "")
-        record = rpi_data.get("rpi_record", "")
-        roster_url = team_info.get("url", "")
-        stats_url = team_info.get("stats_url", "")
+                # Get RPI rank and record from RPI lookup using canonical team names
+                stats_team_name = team_df["stats_team"].iloc[0] if "stats_team" in team_df.columns else team_name
+                stats_team_canonical = resolve_canonical_team_name(stats_team_name)
+                if not stats_team_canonical:
+                    stats_team_canonical = resolve_canonical_team_name(team_name)
+                if not stats_team_canonical:
+                    stats_team_canonical = team_name
+                stats_team_key = normalize_school_key(stats_team_canonical)
+                rpi_data = rpi_lookup.get(stats_team_key, {}) or rpi_lookup.get(team_key, {})
+                rank = rpi_data.get("rpi_rank", "")
+                record = rpi_data.get("rpi_record", "")
+                roster_url = team_info.get("url", "")
+                stats_url = team_info.get("stats_url", "")
         
-        # Calculate positional flags for each player (input already normalized)
-        players_data = []
-        for _, row in team_df.iterrows():
-            position_raw = str(row.get("position", ""))
-            pos_codes = extract_position_codes(position_raw)
-
-            has_s = "S" in pos_codes
-            has_pin = ("OH" in pos_codes) or ("RS" in pos_codes)
-            has_middle = "MB" in pos_codes
-            has_def = "DS" in pos_codes
-
-            # Treat setters only when they are pure setters or RS/S.
-            # Exclude hybrid OH/S or MB/S from the setter count.
-            is_setter = False
-            if has_s:
-                if has_middle or ("OH" in pos_codes):
+                # Calculate positional flags for each player (input already normalized)
+                players_data = []
+                outgoing_names = outgoing_names_by_team.get(team_key, set())
+                for _, row in team_df.iterrows():
+                    position_raw = str(row.get("position", ""))
+                    pos_codes = extract_position_codes(position_raw)
+
+                    has_s = "S" in pos_codes
+                    has_pin = ("OH" in pos_codes) or ("RS" in pos_codes)
+                    has_middle = "MB" in pos_codes
+                    has_def = "DS" in pos_codes
+
+                    # Treat setters only when they are pure setters or RS/S.
+                    # Exclude hybrid OH/S or MB/S from the setter count.
                     is_setter = False
-                elif "RS" in pos_codes:
-                    is_setter = True
-                elif not has_pin and not has_def:
-                    is_setter = True
-
-            is_pin = has_pin
-            is_middle = has_middle
-            is_def = has_def
+                    if has_s:
+                        if has_middle or ("OH" in pos_codes):
+                            is_setter = False
+                        elif "RS" in pos_codes:
+                            is_setter = True
+                        elif not has_pin and not has_def:
+                            is_setter = True
+
+                    is_pin = has_pin
+                    is_middle = has_middle
+                    is_def = has_def
             
-            class_str = str(row.get("class", ""))
-            class_norm = normalize_class(class_str)
-            is_grad = is_graduating(class_norm)
-            class_next = class_next_year(class_norm)
+                    class_str = str(row.get("class", ""))
+                    class_norm = normalize_class(class_str)
+                    is_grad = is_graduating(class_norm)
+                    class_next = class_next_year(class_norm)
             
-            # Check if outgoing transfer
-            player_name = str(row.get("name", ""))
-            is_outgoing = False
-            for xfer in outgoing_by_team.get(team_key, []):
-                if normalize_player_name(xfer["name"]) == normalize_player_name(player_name):
-                    is_outgoing = True
-                    break
-
-            assists_val = to_int_safe(row.get("assists", 0))
+                    # Check if outgoing transfer
+                    player_name = str(row.get("name", ""))
+                    is_outgoing = bool(outgoing_names) and normalize_player_name(player_name) in outgoing_names
+
+                    assists_val = int(row["assists"])
             
-            players_data.append({
-                "name": player_name,
-                "position_raw": position_raw,
-                "pos_codes": pos_codes,
-                "is_setter": is_setter,
-                "is_pin": is_pin,
-                "is_middle": is_middle,
-                "is_def": is_def,
-                "class": class_norm,
-                "class_next": class_next,
-                "is_graduating": is_grad,
-                "is_outgoing_transfer": is_outgoing,
-                "height": str(row.get("height", "")),
-                "assists": assists_val,
-                "kills": to_int_safe(row.get("kills", 0)),
-                "digs": to_int_safe(row.get("digs", 0)),
-            })
+                    # Parse height once per player; a player can land in several
+                    # position groups, and avg_height reads the parsed value.
+                    height_str = str(row.get("height", ""))
+                    players_data.append(RosterPlayer(
+                        name=player_name,
+                        position_raw=position_raw,
+                        pos_codes=pos_codes,
+                        is_setter=is_setter,
+                        is_pin=is_pin,
+                        is_middle=is_middle,
+                        is_def=is_def,
+                        class_norm=class_norm,
+                        class_next=class_next,
+                        is_graduating=is_grad,
+                        is_outgoing_transfer=is_outgoing,
+                        height=height_str,
+                        height_in=height_to_inches(height_str),
+                        assists=assists_val,
+                        kills=int(row["kills"]),
+                        digs=int(row["digs"]),
+                    ))
         
-        # Calculate returning players (not graduating, not outgoing transfer)
-        returning_players = [p for p in players_data if not p["is_graduating"] and not p["is_outgoing_transfer"]]
+                # Calculate returning players (not graduating, not outgoing transfer)
+                returning_players = [p for p in players_data if not p.is_graduating and not p.is_outgoing_transfer]
         
-        # Returning by position
-        ret_setters = [p for p in returning_players if p["is_setter"]]
-        # Count any returning player with meaningful assists as a setter, even if hybrid
-        ret_setters_assist_bonus = [
-            p for p in returning_players if p["assists"] >= 150 and p not in ret_setters
-        ]
-        ret_setters_extended = ret_setters + ret_setters_assist_bonus
-        ret_pins = [p for p in returning_players if p["is_pin"]]
-        ret_middles = [p for p in returning_players if p["is_middle"]]
-        ret_defs = [p for p in returning_players if p["is_def"]]
+                # Returning by position
+                ret_setters = [p for p in returning_players if p.is_setter]
+                # Count any returning player with meaningful assists as a setter, even if hybrid
+                ret_setters_assist_bonus = [
+                    p for p in returning_players if p.assists >= 150 and not p.is_setter
+                ]
+                ret_setters_extended = ret_setters + ret_setters_assist_bonus
+                ret_pins = [p for p in returning_players if p.is_pin]
+                ret_middles = [p for p in returning_players if p.is_middle]
+                ret_defs = [p for p in returning_players if p.is_def]
         
-        # Format returning player names with class and primary stat
-        def format_returning(players, stat_key):
-            parts = []
-            for p in players:
-                stat_val = p.get(stat_key, 0)
-                parts.append(f"{p['name']} - {p['class_next']} ({stat_val})")
-            return ", ".join(parts)
+                # Format returning player names with class and primary stat
+                def format_returning(players, stat_key):
+                    parts = []
+                    for p in players:
+                        stat_val = getattr(p, stat_key)
+                        parts.append(f"{p.name} - {p.class_next} ({stat_val})")
+                    return ", ".join(parts)
         
-        ret_setter_names = format_returning(ret_setters_extended, "assists")
-        ret_pin_names = format_returning(ret_pins, "kills")
-        ret_middle_names = format_returning(ret_middles, "kills")
-        ret_def_names = format_returning(ret_defs, "digs")
+                ret_setter_names = format_returning(ret_setters_extended, "assists")
+                ret_pin_names = format_returning(ret_pins, "kills")
+                ret_middle_names = format_returning(ret_middles, "kills")
+                ret_def_names = format_returning(ret_defs, "digs")
         
-        # Incoming players from incoming_players.py
-        incoming_for_team = [p for p in incoming_players if normalize_school_key(p["school"]) == team_key]
+                # Incoming players from incoming_players.py
+                incoming_for_team = incoming_players_by_team.get(team_key, [])
         
-        # Categorize incoming by position
-        inc_setters = []
-        inc_pins = []
-        inc_middles = []
-        inc_defs = []
+                # Categorize incoming by position
+                inc_setters = []
+                inc_pins = []
+                inc_middles = []
+                inc_defs = []
         
-        for p in incoming_for_team:
-            codes = extract_position_codes(p["position"])
-            if ("S" in codes) and ("DS" not in codes):
-                inc_setters.append(p)
-            if ("OH" in codes) or ("RS" in codes):
-                inc_pins.append(p)
-            if "MB" in codes:
-                inc_middles.append(p)
-            if "DS" in codes:
-                inc_defs.append(p)
+                for p in incoming_for_team:
+                    codes = extract_position_codes(p["position"])
+                    if ("S" in codes) and ("DS" not in codes):
+                        inc_setters.append(p)
+                    if ("OH" in codes) or ("RS" in codes):
+                        inc_pins.append(p)
+                    if "MB" in codes:
+                        inc_middles.append(p)
+                    if "DS" in codes:
+                        inc_defs.append(p)
         
-        def format_incoming(players):
-            parts = []
-            for p in players:
-                name = p["name"]
-                pos_label = p["position"]
-                is_transfer = p.get("is_transfer", False)
-
-                class_disp = ""
-                lookup = player_lookup.get(normalize_player_name(name), {})
-                class_next = lookup.get("class_next") or lookup.get("class_norm") or ""
-                if class_next:
-                    class_disp = class_next
-                    if not class_disp.endswith("."):
-                        class_disp = f"{class_disp}."
-
-                # Prefer clean position label from codes if available
-                codes = lookup.get("pos_codes") or extract_position_codes(pos_label)
-                if "S" in codes and len(codes) == 1:
-                    pos_label_fmt = "Setter"
-                elif "MB" in codes and len(codes) == 1:
-                    pos_label_fmt = "Middle"
-                elif "OH" in codes or "RS" in codes:
-                    pos_label_fmt = "Pin"
-                elif "DS" in codes:
-                    pos_label_fmt = "Defender"
-                else:
-                    pos_label_fmt = pos_label
-
-                if is_transfer:
-                    suffix = " - Transfer"
-                    parts.append(
-                        f"{name} ({class_disp} {pos_label_fmt}{suffix})"
-                        .replace("  ", " ")
-                        .replace("( ", "(")
-                        .replace(" )", ")")
-                    )
-                else:
-                    parts.append(f"{name} ({pos_label})")
-            return ", ".join(parts)
+                def format_incoming(players):
+                    parts = []
+                    for p in players:
+                        name = p["name"]
+                        pos_label = p["position"]
+                        is_transfer = p.get("is_transfer", False)
+
+                        class_disp = ""
+                        lookup = player_lookup.get(normalize_player_name(name), {})
+                        class_next = lookup.get("class_next") or lookup.get("class_norm") or ""
+                        if class_next:
+                            class_disp = class_next
+                            if not class_disp.endswith("."):
+                                class_disp = f"{class_disp}."
+
+                        # Prefer clean position label from codes if available
+                        codes = lookup.get("pos_codes") or extract_position_codes(pos_label)
+                        if "S" in codes and len(codes) == 1:
+                            pos_label_fmt = "Setter"
+                        elif "MB" in codes and len(codes) == 1:
+                            pos_label_fmt = "Middle"
+                        elif "OH" in codes or "RS" in codes:
+                            pos_label_fmt = "Pin"
+                        elif "DS" in codes:
+                            pos_label_fmt = "Defender"
+                        else:
+                            pos_label_fmt = pos_label
+
+                        if is_transfer:
+                            suffix = " - Transfer"
+                            parts.append(
+                                f"{name} ({class_disp} {pos_label_fmt}{suffix})"
+                                .replace("  ", " ")
+                                .replace("( ", "(")
+                                .replace(" )", ")")
+                            )
+                        else:
+                            parts.append(f"{name} ({pos_label})")
+                    return ", ".join(parts)
         
-        inc_setter_names = format_incoming(inc_setters)
-        inc_pin_names = format_incoming(inc_pins)
-        inc_middle_names = format_incoming(inc_middles)
-        inc_def_names = format_incoming(inc_defs)
+                inc_setter_names = format_incoming(inc_setters)
+                inc_pin_names = format_incoming(inc_pins)
+                inc_middle_names = format_incoming(inc_middles)
+                inc_def_names = format_incoming(inc_defs)
         
-        # Projected counts
-        proj_setter_count = len(ret_setters_extended) + len(inc_setters)
-        proj_pin_count = len(ret_pins) + len(inc_pins)
-        proj_middle_count = len(ret_middles) + len(inc_middles)
-        proj_def_count = len(ret_defs) + len(inc_defs)
+                # Projected counts
+                proj_setter_count = len(ret_setters_extended) + len(inc_setters)
+                proj_pin_count = len(ret_pins) + len(inc_pins)
+                proj_middle_count = len(ret_middles) + len(inc_middles)
+                proj_def_count = len(ret_defs) + len(inc_defs)
         
-        # Transfers
-        outgoing_xfers = outgoing_by_team.get(team_key, [])
-        incoming_xfers = incoming_by_team.get(team_key, [])
+                # Transfers
+                outgoing_xfers = outgoing_by_team.get(team_key, [])
+                incoming_xfers = incoming_by_team.get(team_key, [])
         
-        def format_transfers(xfers):
-            return ", ".join([f"{x['name']}" for x in xfers])
+                def format_transfers(xfers):
+                    return ", ".join([f"{x['name']}" for x in xfers])
         
-        outgoing_transfers_str = format_transfers(outgoing_xfers)
-        incoming_transfers_str = format_transfers(incoming_xfers)
+                outgoing_transfers_str = format_transfers(outgoing_xfers)
+                incoming_transfers_str = format_transfers(incoming_xfers)
         
-        # Average heights
-        def avg_height(players):
-            heights = [height_to_inches(p["height"]) for p in players]
-            heights = [h for h in heights if not pd.isna(h)]
-            if heights:
-                return inches_to_height(sum(heights) / len(heights))
-            return ""
+                # Average heights
+                def avg_height(players):
+                    heights = [p.height_in for p in players if not pd.isna(p.height_in)]
+                    if heights:
+                        return inches_to_height(sum(heights) / len(heights))
+                    return ""
         
-        avg_setter_height = avg_height(ret_setters_extended)
-        avg_pin_height = avg_height(ret_pins)
-        avg_middle_height = avg_height(ret_middles)
-        avg_def_height = avg_height(ret_defs)
+                avg_setter_height = avg_height(ret_setters_extended)
+                avg_pin_height = avg_height(ret_pins)
+                avg_middle_height = avg_height(ret_middles)
+                avg_def_height = avg_height(ret_defs)
         
-        # Offense type (based on assists >= 350)
-        setters_with_assists = [p for p in players_data if p["is_setter"] and p["assists"] >= 350]
-        if len(setters_with_assists) >= 2:
-            offense_type = "6-2"
-        elif len(setters_with_assists) == 1:
-            offense_type = "5-1"
-        else:
-            offense_type = "Unknown"
+                # Offense type (based on assists >= 350)
+                setters_with_assists = [p for p in players_data if p.is_setter and p.assists >= 350]
+                if len(setters_with_assists) >= 2:
+                    offense_type = "6-2"
+                elif len(setters_with_assists) == 1:
+                    offense_type = "5-1"
+                else:
+                    offense_type = "Unknown"
         
-        # Get coaches from teams.json lookup
-        coach_cols = {}
-        coaches = team_coach_lookup.get(team_key, [])
-        if coaches:
-            coach_cols = pack_coaches_for_row(coaches)
-        else:
-            coach_cols = pack_coaches_for_row([])
+                # Get coaches from teams.json lookup
+                coach_cols = {}
+                coaches = team_coach_lookup.get(team_key, [])
+                if coaches:
+                    coach_cols = pack_coaches_for_row(coaches)
+                else:
+                    coach_cols = pack_coaches_for_row([])
         
-        # Build result row
-        result = {
-            "team": team_name,
-            "conference": conference,
-            "roster_url": roster_url,
-            "stats_url": stats_url,
-            "rank": rank,
-            "record": record,
-            "offense_type": offense_type,
+                # Build result row
+                result = {
+                    "team": team_name,
+                    "conference": conference,
+                    "roster_url": roster_url,
+                    "stats_url": stats_url,
+                    "rank": rank,
+                    "record": record,
+                    "offense_type": offense_type,
             
-            "returning_setter_count": len(ret_setters),
-            "returning_setter_names": ret_setter_names,
-            "incoming_setter_count": len(inc_setters),
-            "incoming_setter_names": inc_setter_names,
-            "projected_setter_count": proj_setter_count,
-            "avg_setter_height": avg_setter_height,
+                    "returning_setter_count": len(ret_setters),
+                    "returning_setter_names": ret_setter_names,
+                    "incoming_setter_count": len(inc_setters),
+                    "incoming_setter_names": inc_setter_names,
+                    "projected_setter_count": proj_setter_count,
+                    "avg_setter_height": avg_setter_height,
             
-            "returning_pin_count": len(ret_pins),
-            "returning_pin_names": ret_pin_names,
-            "incoming_pin_count": len(inc_pins),
-            "incoming_pin_names": inc_pin_names,
-            "projected_pin_count": proj_pin_count,
-            "avg_pin_height": avg_pin_height,
+                    "returning_pin_count": len(ret_pins),
+                    "returning_pin_names": ret_pin_names,
+                    "incoming_pin_count": len(inc_pins),
+                    "incoming_pin_names": inc_pin_names,
+                    "projected_pin_count": proj_pin_count,
+                    "avg_pin_height": avg_pin_height,
             
-            "returning_middle_count": len(ret_middles),
-            "returning_middle_names": ret_middle_names,
-            "incoming_middle_count": len(inc_middles),
-            "incoming_middle_names": inc_middle_names,
-            "projected_middle_count": proj_middle_count,
-            "avg_middle_height": avg_middle_height,
+                    "returning_middle_count": len(ret_middles),
+                    "returning_middle_names": ret_middle_names,
+                    "incoming_middle_count": len(inc_middles),
+                    "incoming_middle_names": inc_middle_names,
+                    "projected_middle_count": proj_middle_count,
+                    "avg_middle_height": avg_middle_height,
             
-            "returning_def_count": len(ret_defs),
-            "returning_def_names": ret_def_names,
-            "incoming_def_count": len(inc_defs),
-            "incoming_def_names": inc_def_names,
-            "projected_def_count": proj_def_count,
-            "avg_def_height": avg_def_height,
+                    "returning_def_count": len(ret_defs),
+                    "returning_def_names": ret_def_names,
+                    "incoming_def_count": len(inc_defs),
+                    "incoming_def_names": inc_def_names,
+                    "projected_def_count": proj_def_count,
+                    "avg_def_height": avg_def_height,
             
-            "outgoing_transfers": outgoing_transfers_str,
-            "incoming_transfers": incoming_transfers_str,
-        }
+                    "outgoing_transfers": outgoing_transfers_str,
+                    "incoming_transfers": incoming_transfers_str,
+                }
         
-        result.update(coach_cols)
-        results.append(result)
-    
-    # Write output
-    logger.info("Writing team pivot to: %s", output_csv)
+                result.update(coach_cols)
+            
+                if writer is None:
+                    # Every row is built from the same literal keys, so the first
+                    # row's keys are the header. Pull values in header order with a
+                    # single itemgetter instead of DictWriter's per-field lookups.
+                    fieldnames = list(result)
+                    get_cols = itemgetter(*fieldnames)
+                    writer = csv.writer(f, lineterminator="\n")
+                    writer.writerow(fieldnames)
+                writer.writerow(get_cols(result))
+                row_count += 1
+    except BaseException:
+        # Don't leave a partial temp file behind on a failed or interrupted run
+        if os.path.exists(tmp_csv):
+            os.remove(tmp_csv)
+        raise
     
-    if results:
-        fieldnames = list(results[0].keys())
-        with open(output_csv, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
-        
-        logger.info("Wrote %d team rows", len(results))
+    if row_count:
+        os.replace(tmp_csv, output_csv)
+        logger.info("Wrote %d team rows", row_count)
     else:
+        os.remove(tmp_csv)
         logger.warning("No results to write")
 
 
@@ -540,6 +615,11 @@ if __name__ == "__main__":
         default=None,
         help="Optional path to teams.json (default: settings/teams.json)"
     )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Write the pivot gzip-compressed (appends .gz to --output)"
+    )
     args = parser.parse_args()
     
     setup_logging()
@@ -547,4 +627,5 @@ if __name__ == "__main__":
         input_csv=args.input,
         output_csv=args.output,
         teams_json_path=args.teams_json,
+        gzip_output=args.gzip,
     )
@@ -65,9 +65,11 @@ def export_to_csv():
             "class",
             "class_next",
         ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        # Rows are built as tuples in header order, so a plain writer avoids
+        # DictWriter's per-row dict construction and per-field lookups.
+        writer = csv.writer(csvfile, lineterminator="\n")
         
-        writer.writeheader()
+        writer.writerow(fieldnames)
         for row in OUTGOING_TRANSFERS:
             pos_raw = row.get("position", "") if isinstance(row, dict) else ""
             codes = extract_position_codes(str(pos_raw))
@@ -95,16 +97,16 @@ def export_to_csv():
             cls_norm = normalize_class(str(cls_raw)) if cls_raw else ""
             cls_next = class_next_year(cls_norm) if cls_norm else ""
 
-            writer.writerow({
-                "name": row.get("name"),
-                "old_team": row.get("old_team"),
-                "new_team": row.get("new_team"),
-                "year": row.get("year"),
-                "position": pos_raw,
-                "position_norm": pos_norm,
-                "class": cls_norm,
-                "class_next": cls_next,
-            })
+            writer.writerow((
+                row.get("name"),
+                row.get("old_team"),
+                row.get("new_team"),
+                row.get("year"),
+                pos_raw,
+                pos_norm,
+                cls_norm,
+                cls_next,
+            ))
     
     print(f"✓ Exported {len(OUTGOING_TRANSFERS)} transfers to {output_file}")
 
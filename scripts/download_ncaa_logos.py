@@ -34,8 +34,18 @@ OUTPUT_DIR_DEFAULT = Path("assets/logos/ncaa")
 REQUEST_DELAY_SECONDS = 0.25  # 0.25s => max 4 requests/sec (< 5 rps limit)
 MAPPING_CSV_DEFAULT = Path("exports/ncaa_logo_mapping.csv")
 
+# Every request goes to BASE_URL; one session keeps the connection alive
+# across the two logo downloads per team instead of reconnecting each time.
+SESSION = requests.Session()
+
 LOG = logging.getLogger(__name__)
 
+# Filler words dropped by normalize_name, as one alternation so each name is
+# scanned once rather than once per word.
+NAME_STOPWORDS = ("university", "the", "college", "at", "of", "state", "campus")
+NAME_STOPWORDS_RE = re.compile(r"\b(?:" + "|".join(NAME_STOPWORDS) + r")\b")
+NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+
 
 # ----------- HELPERS -----------
 
@@ -50,7 +60,7 @@ def save_teams(path: Path, teams: List[Dict[str, Any]]) -> None:
 
 
 def safe_name_from_team(team_name: str) -> str:
-    return re.sub(r"[^A-Za-z0-9]+", "_", team_name).strip("_")
+    return NON_ALNUM_RE.sub("_", team_name).strip("_")
 
 
 def save_logo(content: bytes, team_name: str, variant: str, output_dir: Path) -> Path:
@@ -73,17 +83,16 @@ def normalize_name(name: str) -> str:
     - Remove punctuation
     """
     s = name.lower()
-    for token in ["university", "the", "college", "at", "of", "state", "campus"]:
-        s = re.sub(rf"\b{token}\b", " ", s)
-    s = re.sub(r"[^a-z0-9]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = NAME_STOPWORDS_RE.sub(" ", s)
+    # Runs of anything else (spaces included) collapse to a single space
+    s = NON_ALNUM_RE.sub(" ", s).strip()
     return s
 
 
 def fetch_schools_index() -> List[Dict[str, Any]]:
     url = f"{BASE_URL}/schools-index"
     LOG.info("Fetching schools index from %s", url)
-    resp = requests.get(url, timeout=15)
+    resp = SESSION.get(url, timeout=15)
     resp.raise_for_status()
     data = resp.json()
     if not isinstance(data, list):
@@ -224,7 +233,7 @@ def download_logo(slug: str, variant: str) -> Optional[bytes]:
 
     url = f"{BASE_URL}/logo/{slug}.svg"
     try:
-        resp = requests.get(url, params=params, timeout=15)
+        resp = SESSION.get(url, params=params, timeout=15)
     except Exception as e:
         LOG.error("Error fetching %s logo for slug '%s': %s", variant, slug, e)
         return None
@@ -11,12 +11,13 @@ Usage:
     python scripts/fetch_coaches.py --teams "Stanford University" "University of Texas"
     python scripts/fetch_coaches.py --teams-json settings/teams.json
     python scripts/fetch_coaches.py --tenure   # also fetches bio pages for tenure info
+    python scripts/fetch_coaches.py --workers 4
 """
 
 import argparse
 import json
-import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlsplit
 
@@ -24,25 +25,26 @@ from urllib.parse import urlsplit
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scripts.helpers.teams_loader import load_teams
-from scripts.helpers.coaches import find_coaches_page_url, parse_coaches_from_html
-from scripts.helpers.utils import fetch_html, normalize_school_key, normalize_text
+from scripts.helpers.coaches import (
+    Coach,
+    guess_coaches_url_from_pattern,
+    parse_coaches_from_html,
+    parse_html,
+    scan_coaches_url_from_html,
+)
+from scripts.helpers.utils import fetch_html, normalize_school_key, normalize_text, slugify
 from scripts.helpers.logging_utils import setup_logging, get_logger
 import requests
 
-setup_logging()
 logger = get_logger(__name__)
 ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
 COACH_PHOTOS_DIR = ASSETS_DIR / "coaches_photos"
-COACH_PHOTOS_DIR.mkdir(parents=True, exist_ok=True)
 VALID_PHOTO_EXTS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+PHOTO_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; coaches-photo-fetcher/1.0)"}
 
 
 def _slugify_filename(value: str) -> str:
-    text = normalize_text(value)
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "_", text)
-    text = re.sub(r"_+", "_", text).strip("_")
-    return text or "coach"
+    return slugify(normalize_text(value).lower()) or "coach"
 
 
 def _download_coach_photo(team_name: str, coach_name: str, photo_url: str) -> str:
@@ -60,9 +62,8 @@ def _download_coach_photo(team_name: str, coach_name: str, photo_url: str) -> st
     if dest.exists():
         return f"assets/coaches_photos/{filename}"
 
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; coaches-photo-fetcher/1.0)"}
     try:
-        resp = requests.get(photo_url, headers=headers, timeout=30)
+        resp = requests.get(photo_url, headers=PHOTO_HEADERS, timeout=30)
         resp.raise_for_status()
     except Exception as exc:
         logger.warning("Failed to download coach photo for %s (%s): %s", coach_name, team_name, exc)
@@ -77,16 +78,18 @@ def _download_coach_photo(team_name: str, coach_name: str, photo_url: str) -> st
         return ""
 
 
-def _attach_coach_photo(team_name: str, coach: dict) -> None:
-    photo_url = (coach.pop("photo_url", "") or "").strip()
+def _attach_coach_photo(team_name: str, coach: Coach) -> None:
+    photo_url = (coach.photo_url or "").strip()
+    coach.photo_url = ""
     if not photo_url:
         return
-    photo_path = _download_coach_photo(team_name, coach.get("name", "coach"), photo_url)
+    photo_path = _download_coach_photo(team_name, coach.name or "coach", photo_url)
     if photo_path:
-        coach["coach_photo"] = photo_path
+        coach.coach_photo = photo_path
 
 
 DEFAULT_TEAMS_JSON = Path(__file__).resolve().parent.parent / "settings" / "teams.json"
+DEFAULT_WORKERS = 8
 
 
 def fetch_coaches_for_team(team_info: dict, fetch_tenure: bool = False) -> list:
@@ -98,7 +101,7 @@ def fetch_coaches_for_team(team_info: dict, fetch_tenure: bool = False) -> list:
         fetch_tenure: If True, fetch individual bio pages to estimate start year / seasons.
         
     Returns:
-        List of coach dicts: [{"name": ..., "title": ..., "email": ..., "phone": ...}]
+        List of coach dicts for teams.json: [{"name": ..., "title": ..., "email": ..., "phone": ...}]
     """
     team_name = team_info["team"]
     roster_url = team_info.get("url", "")
@@ -108,38 +111,58 @@ def fetch_coaches_for_team(team_info: dict, fetch_tenure: bool = False) -> list:
         return []
     
     try:
-        # Fetch roster page
         logger.info(f"Fetching coaches for: {team_name}")
-        roster_html = fetch_html(roster_url)
-        
-        # Try to find dedicated coaches page
-        coaches_html = roster_html
-        alt_coaches_url = find_coaches_page_url(roster_html, roster_url)
-        
-        if alt_coaches_url:
+        coaches = []
+
+        # Most sites serve staff next to the roster (/roster -> /coaches); try
+        # that first so the roster page is only fetched and parsed when needed.
+        guessed_url = guess_coaches_url_from_pattern(roster_url)
+        if guessed_url:
             try:
-                logger.debug(f"  Fetching coaches page: {alt_coaches_url}")
-                coaches_html = fetch_html(alt_coaches_url)
+                logger.debug(f"  Fetching pattern coaches page: {guessed_url}")
+                coaches = parse_coaches_from_html(
+                    fetch_html(guessed_url),
+                    base_url=guessed_url,
+                    fetch_bios=fetch_tenure,
+                )
             except Exception as e:
-                logger.warning(f"  Could not fetch coaches page URL, using roster: {e}")
-        
-        # Parse coaches from HTML
-        coaches = parse_coaches_from_html(
-            coaches_html,
-            base_url=alt_coaches_url or roster_url,
-            fetch_bios=fetch_tenure,
-        )
+                logger.debug(f"  Pattern coaches page unavailable, scanning roster: {e}")
+
+        if not coaches:
+            # Fetch roster page and parse it once; it is reused below if
+            # there is no separate coaches page
+            roster_html = fetch_html(roster_url)
+            roster_soup = parse_html(roster_html)
+
+            # Try to find dedicated coaches page linked from the roster
+            coaches_html = roster_soup
+            alt_coaches_url = scan_coaches_url_from_html(roster_soup, roster_url)
+            if alt_coaches_url == guessed_url:
+                alt_coaches_url = None  # already tried above
+
+            if alt_coaches_url:
+                try:
+                    logger.debug(f"  Fetching coaches page: {alt_coaches_url}")
+                    coaches_html = fetch_html(alt_coaches_url)
+                except Exception as e:
+                    logger.warning(f"  Could not fetch coaches page URL, using roster: {e}")
+
+            # Parse coaches from HTML
+            coaches = parse_coaches_from_html(
+                coaches_html,
+                base_url=alt_coaches_url or roster_url,
+                fetch_bios=fetch_tenure,
+            )
         
         if coaches:
             logger.info(f"  Found {len(coaches)} coach(es)")
             for coach in coaches:
-                coach.setdefault("coach_photo", "")
                 _attach_coach_photo(team_name, coach)
-                logger.debug(f"    - {coach['name']} ({coach['title']})")
+                logger.debug(f"    - {coach.name} ({coach.title})")
         else:
             logger.warning(f"  No coaches found for {team_name}")
         
-        return coaches
+        return [coach.to_dict() for coach in coaches]
         
     except Exception as e:
         logger.error(f"Error fetching coaches for {team_name}: {e}")
@@ -147,6 +170,8 @@ def fetch_coaches_for_team(team_info: dict, fetch_tenure: bool = False) -> list:
 
 
 def main():
+    setup_logging()
+    COACH_PHOTOS_DIR.mkdir(parents=True, exist_ok=True)
     parser = argparse.ArgumentParser(description="Fetch coaching staff data and populate teams.json")
     parser.add_argument(
         "--teams",
@@ -164,6 +189,12 @@ def main():
         default=DEFAULT_TEAMS_JSON,
         help="Path to teams.json to read/write (default: settings/teams.json)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Teams to fetch concurrently (default: {DEFAULT_WORKERS})",
+    )
     
     args = parser.parse_args()
     
@@ -183,17 +214,22 @@ def main():
         logger.info("No teams to fetch")
         return
     
-    # Fetch coaches for each team
+    # Fetch coaches for each team. Work is network-bound and each team lives
+    # on its own site, so fan out across threads; fetch_html caps per-host load.
     success_count = 0
     error_count = 0
     fetched_map = {}
 
-    for i, team_info in enumerate(teams_to_fetch, 1):
+    def _fetch(indexed_team):
+        i, team_info = indexed_team
+        logger.info(f"[{i}/{len(teams_to_fetch)}] Processing: {team_info['team']}")
+        return team_info, fetch_coaches_for_team(team_info, fetch_tenure=args.tenure)
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        results = list(executor.map(_fetch, enumerate(teams_to_fetch, 1)))
+
+    for team_info, coaches in results:
         team_name = team_info["team"]
-        logger.info(f"[{i}/{len(teams_to_fetch)}] Processing: {team_name}")
-        
-        coaches = fetch_coaches_for_team(team_info, fetch_tenure=args.tenure)
-        
         if coaches:
             # Ensure coach_photo key exists for downstream use
             for c in coaches:
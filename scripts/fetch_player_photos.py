@@ -20,6 +20,7 @@ Usage example:
 import argparse
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Iterable, Optional
 from urllib.parse import urljoin, urlparse
@@ -28,18 +29,17 @@ import pandas as pd
 from playwright.sync_api import sync_playwright
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.helpers.utils import slugify
+
 DEFAULT_INPUT = ROOT_DIR / "scripts" / "ncaa_wvb_rosters_d1_2025.csv"
 PHOTOS_DIR = ROOT_DIR / "assets" / "player_photos"
 TEAMS_JSON = ROOT_DIR / "settings" / "teams.json"
 DEFAULT_MISSING_OUTPUT = ROOT_DIR / "exports" / "missing_player_photos_after_fetch.csv"
 
 
-def slugify(s: str) -> str:
-    s = re.sub(r"[^A-Za-z0-9]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-    return s
-
-
 def build_team_maps() -> tuple[dict[str, str], dict[str, str]]:
     """Returns (alias->canonical_slug, canonical_slug->roster_url)."""
     aliases: dict[str, str] = {}
@@ -100,7 +100,7 @@ def find_existing_photo(team: str, player: str, photo_index: dict[str, str], tea
 
 def choose_best_image(candidates: Iterable[dict], player: str) -> Optional[str]:
     """Pick the best image URL from a list of {src, alt, aria} dicts."""
-    player_tokens = [t for t in re.split(r"\\s+", player.lower()) if t]
+    player_tokens = player.lower().split()
     best = None
     for c in candidates:
         src = c.get("src") or ""
@@ -190,6 +190,13 @@ def process_missing_photos(
     if limit:
         missing_rows = missing_rows[:limit]
 
+    # Group players by team (keeping first-seen team order) so each roster
+    # page is loaded once and every missing player on it is looked up in turn.
+    by_team: dict[str, list[dict]] = {}
+    for rec in missing_rows:
+        by_team.setdefault(rec["Team"], []).append(rec)
+    missing_rows = [rec for recs in by_team.values() for rec in recs]
+
     if not missing_rows:
         print("All players already have photos.")
         return
@@ -202,6 +209,7 @@ def process_missing_photos(
         page = context.new_page()
 
         still_missing = []
+        loaded_url = None
         for idx, rec in enumerate(missing_rows, start=1):
             team = rec["Team"]
             player = rec["Player"]
@@ -214,12 +222,15 @@ def process_missing_photos(
                 still_missing.append(rec)
                 continue
 
-            try:
-                page.goto(roster_url, wait_until="domcontentloaded", timeout=60000)
-            except Exception as exc:
-                print(f"(failed to load roster: {exc})")
-                still_missing.append(rec)
-                continue
+            if roster_url != loaded_url:
+                try:
+                    page.goto(roster_url, wait_until="domcontentloaded", timeout=60000)
+                except Exception as exc:
+                    print(f"(failed to load roster: {exc})")
+                    still_missing.append(rec)
+                    loaded_url = None
+                    continue
+                loaded_url = roster_url
 
             img_url = fetch_photo_for_player(page, page.url, player)
             if not img_url:
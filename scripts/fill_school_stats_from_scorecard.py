@@ -145,15 +145,32 @@ def name_similarity(a: str, b: str) -> float:
     return inter / union
 
 
+def build_token_index(all_rows: List[Tuple[str, Dict[str, str]]]) -> Dict[str, List[int]]:
+    """
+    Map each name token to the positions in all_rows whose normalized name
+    contains it, in all_rows order.
+    """
+    token_index: Dict[str, List[int]] = {}
+    for i, (norm_row, _) in enumerate(all_rows):
+        for token in set(norm_row.split()):
+            token_index.setdefault(token, []).append(i)
+    return token_index
+
+
 def find_best_match(
     name_candidates: List[str],
     index_by_name: Dict[str, Dict[str, str]],
     all_rows: List[Tuple[str, Dict[str, str]]],
+    token_index: Optional[Dict[str, List[int]]] = None,
 ) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
     """
     Given a list of candidate names for a team (team, short_name, aliases),
     try to find the best Scorecard row.
 
+    With token_index (from build_token_index), the fuzzy pass only scores
+    rows sharing a token with a candidate; the rest have similarity 0 and
+    could never be chosen, so the result is the same as a full scan.
+
     Returns (row, confidence) where confidence is one of:
       - "high"   -> exact normalized name match
       - "medium" -> good fuzzy match (similarity >= 0.80)
@@ -178,8 +195,18 @@ def find_best_match(
     best_row: Optional[Dict[str, str]] = None
     best_score = 0.0
 
-    # Fuzzy over all institutions
-    for norm_row, row in all_rows:
+    # Fuzzy over all institutions, or just those sharing a token
+    rows = all_rows
+    if token_index is not None:
+        positions = {
+            i
+            for norm in tried_norms
+            for token in norm.split()
+            for i in token_index.get(token, ())
+        }
+        rows = [all_rows[i] for i in sorted(positions)]
+
+    for norm_row, row in rows:
         if not norm_row:
             continue
         for norm in tried_norms:
@@ -509,6 +536,7 @@ def main() -> None:
         teams = json.load(f)
 
     index_by_name, index_by_unitid, all_rows = load_scorecard_index()
+    token_index = build_token_index(all_rows)
 
     matched = 0
     unmatched: List[str] = []
@@ -551,7 +579,7 @@ def main() -> None:
                     name_candidates.append(alias)
 
             scorecard_row, confidence = find_best_match(
-                name_candidates, index_by_name, all_rows
+                name_candidates, index_by_name, all_rows, token_index
             )
 
             # If this is our first time matching AND the match is high confidence,
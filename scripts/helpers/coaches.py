@@ -2,17 +2,116 @@
 from __future__ import annotations
 
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict
 
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, NavigableString, Tag
 from urllib.parse import urljoin
 
-from .utils import normalize_text, fetch_html
+from .utils import MAX_REQUESTS_PER_HOST, normalize_text, fetch_html
 from .logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer the C-based lxml tree builder; fall back to the stdlib parser when
+# lxml is not installed.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - optional dependency
+    HTML_PARSER = "html.parser"
+
+# selectolax's lexbor parser is much faster than BeautifulSoup for the
+# CSS-driven Sidearm branch of parse_coaches_from_html.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
+
+# li.sidearm-roster-coach is already covered by .sidearm-roster-coach; listing
+# it too only made lexbor return those blocks twice.
+SIDEARM_COACH_SELECTOR = (
+    ".sidearm-roster-coach, "
+    ".sidearm-roster-coaches li, "
+    "div.sidearm-coach, "
+    "div.coach-card"
+)
+# Compiled once; soup.select() would look the selector string up on every call.
+SIDEARM_COACH_MATCHER = soupsieve.compile(SIDEARM_COACH_SELECTOR)
+# Every SIDEARM_COACH_SELECTOR class contains one of these; pages without any
+# of them skip the Sidearm pass instead of building a tree to find nothing.
+SIDEARM_MARKER_RE = re.compile(r"sidearm-roster-coach|sidearm-coach|coach-card", flags=re.I)
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", flags=re.I)
+PHONE_RE = re.compile(r"\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}", flags=re.I)
+# Email and phone in one alternation so a block's text is scanned once.
+CONTACT_RE = re.compile(rf"(?P<email>{EMAIL_RE.pattern})|(?P<phone>{PHONE_RE.pattern})", flags=re.I)
+# Comments and <script>/<style> blocks, leftmost first so a comment that
+# contains "<script>" (or vice versa) is dropped as a whole, as a tokenizer would.
+NON_CONTENT_RE = re.compile(r"<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>", flags=re.I | re.S)
+# Title cleanup in the staff-row fallback: phone numbers, emails and (for the
+# primary title) "/Volleyball" removed in one pass. Phone is listed first so a
+# digit run is stripped before an email match can claim it.
+TITLE_CONTACT_RE = re.compile(rf"{PHONE_RE.pattern}|{EMAIL_RE.pattern}")
+TITLE_STRIP_RE = re.compile(rf"{PHONE_RE.pattern}|{EMAIL_RE.pattern}|/[Vv]olleyball")
+# href matchers for BeautifulSoup find(); a compiled pattern is matched with
+# re.search instead of calling back into a Python lambda per link.
+MAILTO_HREF_RE = re.compile(r"^mailto:")
+TEL_HREF_RE = re.compile(r"^tel:")
+TEL_ANYWHERE_HREF_RE = re.compile(r"tel:")
+# str.startswith with a tuple tests every prefix in one call.
+CONTACT_HREF_PREFIXES = ("mailto:", "tel:")
+# Bio/profile link hints, matched case-insensitively without lowercasing a copy
+# of every link's text and href ("/coach" also covers "/coaches").
+BIO_LINK_TEXT_RE = re.compile(r"bio|profile", flags=re.I)
+BIO_LINK_HREF_RE = re.compile(r"/coach|/staff/", flags=re.I)
+# Link texts (lowercased) the fallback parser never treats as coach names:
+# navigation/accessibility prefixes and title-only links, in one scan.
+SKIP_LINK_NAME_RE = re.compile(r"^(?:full bio|skip to)|jersey number|head coach|assistant coach")
+# Ancestors that bound one staff row in the fallback parser.
+STAFF_ROW_TAGS = frozenset({"tr", "li", "div", "p"})
+COACH_IN_ROW_RE = re.compile(r"[^,;]*coach[^,;]*", flags=re.I)
+
+# Bio pages for every team are fetched on one long-lived pool, so its worker
+# threads (and the requests.Session each keeps via utils._session) are reused
+# across teams rather than created and dropped per team. Sized for
+# fetch_coaches' default 8 team workers x MAX_REQUESTS_PER_HOST.
+BIO_FETCH_WORKERS = 8 * MAX_REQUESTS_PER_HOST
+_BIO_EXECUTOR: ThreadPoolExecutor | None = None
+_BIO_EXECUTOR_LOCK = threading.Lock()
+
+# Row text that marks a staff entry in the fallback branch, fused into one
+# case-insensitive alternation so each row is scanned once.
+STAFF_KEYWORDS = (
+    "coach",
+    "coordinator",
+    "operations",
+    "trainer",
+    "strength & conditioning",
+    "support staff",
+    "director of volleyball",
+)
+STAFF_KEYWORDS_RE = re.compile("|".join(map(re.escape, STAFF_KEYWORDS)), flags=re.I)
+
+# "enters her third season", "is in his 6th year", etc.
+SEASON_RE = re.compile(
+    r"(?:enter(?:ing|s)?|heading into|in|returns for|embarks on)\s+"
+    r"(?:his|her|their)?\s*"
+    r"(?P<num>\d{1,2}|first|second|third|fourth|fifth|sixth|seventh|eighth|ninth|tenth|eleventh|twelfth|thirteenth|fourteenth|fifteenth)"
+    r"(?:st|nd|rd|th)?\s+"
+    r"(?:season|year)",
+    flags=re.I,
+)
+# "hired in 2019", "since 2021", "joined ... in 2020"
+YEAR_RE = re.compile(
+    r"(?:since|hired|joined|named|promoted|appointed|took over)\s+(?:in\s+)?(20\d{2})",
+    flags=re.I,
+)
+
 ORDINAL_WORDS = {
     "first": 1,
     "second": 2,
@@ -32,6 +131,23 @@ ORDINAL_WORDS = {
 }
 
 
+def _build_ordinal_tokens() -> Dict[str, int]:
+    """
+    Every accepted ordinal token -> int: the words above plus 1-49 written as
+    digits, zero-padded ("03"), and with any ordinal suffix ("3rd", "3th").
+    """
+    tokens = dict(ORDINAL_WORDS)
+    for n in range(1, 50):
+        for digits in (str(n), f"{n:02d}"):
+            tokens[digits] = n
+            for suffix in ("st", "nd", "rd", "th"):
+                tokens[digits + suffix] = n
+    return tokens
+
+
+_ORDINAL_TOKENS = _build_ordinal_tokens()
+
+
 def _ordinal_to_int(token: str) -> int | None:
     """
     Convert tokens like 'third', '3rd', '3' into an int.
@@ -39,17 +155,39 @@ def _ordinal_to_int(token: str) -> int | None:
     """
     if not token:
         return None
+    return _ORDINAL_TOKENS.get(token.strip().lower())
 
-    t = token.strip().lower()
-    t = re.sub(r"(st|nd|rd|th)$", "", t)
 
-    if t.isdigit():
-        val = int(t)
-        if 0 < val < 50:
-            return val
-        return None
-
-    return ORDINAL_WORDS.get(t)
+@dataclass(slots=True, eq=False)
+class Coach:
+    """
+    One scraped staff member. Tenure fields and bio_url are filled only when
+    a bio page was fetched; photo_url is the remote image, coach_photo the
+    local copy saved by fetch_coaches.
+    """
+    name: str
+    title: str = ""
+    email: str = ""
+    phone: str = ""
+    photo_url: str = ""
+    start_year: int | None = None
+    seasons_at_school: int | None = None
+    bio_url: str = ""
+    coach_photo: str = ""
+
+    def to_dict(self) -> dict:
+        """
+        The teams.json record: tenure/bio keys only when known, no photo_url.
+        """
+        out = {"name": self.name, "title": self.title, "email": self.email, "phone": self.phone}
+        if self.start_year:
+            out["start_year"] = self.start_year
+        if self.seasons_at_school:
+            out["seasons_at_school"] = self.seasons_at_school
+        if self.bio_url:
+            out["bio_url"] = self.bio_url
+        out["coach_photo"] = self.coach_photo
+        return out
 
 
 def extract_tenure_from_text(text: str, current_year: int | None = None) -> tuple[int | None, int | None]:
@@ -65,15 +203,7 @@ def extract_tenure_from_text(text: str, current_year: int | None = None) -> tupl
     body = normalize_text(text)
 
     # Pattern: "enters her third season", "is in his 6th year", etc.
-    season_match = re.search(
-        r"(?:enter(?:ing|s)?|heading into|in|returns for|embarks on)\s+"
-        r"(?:his|her|their)?\s*"
-        r"(?P<num>\d{1,2}|first|second|third|fourth|fifth|sixth|seventh|eighth|ninth|tenth|eleventh|twelfth|thirteenth|fourteenth|fifteenth)"
-        r"(?:st|nd|rd|th)?\s+"
-        r"(?:season|year)",
-        body,
-        flags=re.I,
-    )
+    season_match = SEASON_RE.search(body)
 
     seasons_at_school: int | None = None
     start_year: int | None = None
@@ -84,12 +214,9 @@ def extract_tenure_from_text(text: str, current_year: int | None = None) -> tupl
             start_year = current_year - seasons_at_school + 1
 
     # Pattern: "hired in 2019", "since 2021", "joined ... in 2020"
-    if start_year is None:
-        year_match = re.search(
-            r"(?:since|hired|joined|named|promoted|appointed|took over)\s+(?:in\s+)?(20\d{2})",
-            body,
-            flags=re.I,
-        )
+    # A plain substring test rules out year-free bios before the regex scan.
+    if start_year is None and "20" in body:
+        year_match = YEAR_RE.search(body)
         if year_match:
             start_year = int(year_match.group(1))
             if current_year and start_year <= current_year:
@@ -98,45 +225,27 @@ def extract_tenure_from_text(text: str, current_year: int | None = None) -> tupl
     return (start_year, seasons_at_school)
 
 
-def find_coaches_page_url(roster_html: str, roster_url: str) -> str | None:
+def parse_html(html: str | BeautifulSoup) -> BeautifulSoup:
     """
-    Try to find a dedicated 'Coaching Staff' or 'Coaches' page from the roster HTML.
-    If not found via links, try common URL patterns.
+    Parse HTML with the preferred tree builder; an already-parsed soup is
+    returned as-is so callers can share one parse across helpers.
+
+    Comments and script/style blocks are cut out before parsing: get_text
+    ignores them anyway, and on large athletics sites they are a big share
+    of the markup BeautifulSoup would otherwise build nodes for.
     """
-    soup = BeautifulSoup(roster_html, "html.parser")
-    
-    # Try "Coaching Staff" link first (but skip if it's just an anchor on same page)
-    a = soup.find("a", string=lambda t: t and "Coaching Staff" in t)
-    if a and a.get("href"):
-        href = a["href"]
-        if not href.startswith("#"):  # Skip in-page anchors
-            url = urljoin(roster_url, href)
-            logger.debug("Found Coaching Staff link: %s", url)
-            return url
+    if isinstance(html, BeautifulSoup):
+        return html
+    return BeautifulSoup(NON_CONTENT_RE.sub("", html), HTML_PARSER)
 
-    # Try "Go To Coaching Staff"
-    a = soup.find("a", string=lambda t: t and "Go To Coaching Staff" in t)
-    if a and a.get("href"):
-        href = a["href"]
-        if not href.startswith("#"):
-            url = urljoin(roster_url, href)
-            logger.debug("Found 'Go To Coaching Staff' link: %s", url)
-            return url
-    
-    # Try just "Coaches" link
-    a = soup.find("a", string=lambda t: t and t.strip() == "Coaches")
-    if a and a.get("href"):
-        href = a["href"]
-        if not href.startswith("#"):
-            url = urljoin(roster_url, href)
-            logger.debug("Found 'Coaches' link: %s", url)
-            return url
 
-    # If no link found, try common URL patterns
+def guess_coaches_url_from_pattern(roster_url: str) -> str | None:
+    """
+    Derive the usual coaches-page URL from the roster URL, without fetching
+    or parsing anything.
+    """
     # roster URL is typically like: https://site.com/sports/womens-volleyball/roster
     # coaches URL is typically: https://site.com/sports/womens-volleyball/coaches
-    logger.debug("No dedicated coaching staff link found, trying common patterns...")
-    
     if "/roster" in roster_url:
         # Try replacing /roster with /coaches
         coaches_url = roster_url.replace("/roster", "/coaches")
@@ -146,32 +255,113 @@ def find_coaches_page_url(roster_html: str, roster_url: str) -> str | None:
         coaches_url = roster_url + "coaches"
         logger.debug("Trying pattern URL: %s", coaches_url)
         return coaches_url
-    
-    logger.debug("Could not determine coaches page URL.")
+
     return None
 
 
-def _find_bio_href(block) -> str | None:
+def scan_coaches_url_from_html(roster_html: str | BeautifulSoup, roster_url: str) -> str | None:
     """
-    Locate the first likely bio/profile link inside a coach block.
+    Look for a 'Coaching Staff' or 'Coaches' link in the roster HTML.
+
+    `roster_html` may be a pre-parsed soup (see parse_html).
     """
-    for a in block.find_all("a", href=True):
-        href = a["href"]
-        text = normalize_text(a.get_text())
-        href_low = href.lower()
-        text_low = text.lower()
-        if "bio" in text_low or "profile" in text_low:
-            return href
-        if "/coach" in href_low or "/coaches" in href_low or "/staff/" in href_low:
-            return href
+    soup = parse_html(roster_html)
+
+    # One pass over the anchors, remembering the first match for each label in
+    # priority order: "Coaching Staff", "Go To Coaching Staff", "Coaches".
+    staff_link = goto_link = coaches_link = None
+    for a in soup.find_all("a"):
+        text = a.string
+        if not text:
+            continue
+        if staff_link is None and "Coaching Staff" in text:
+            staff_link = a
+            href = a.get("href")
+            if href and not href.startswith("#"):
+                break  # best possible match
+        if goto_link is None and "Go To Coaching Staff" in text:
+            goto_link = a
+        if coaches_link is None and text.strip() == "Coaches":
+            coaches_link = a
+
+    for a, label in (
+        (staff_link, "Coaching Staff"),
+        (goto_link, "'Go To Coaching Staff'"),
+        (coaches_link, "'Coaches'"),
+    ):
+        # Skip in-page anchors
+        if a and a.get("href") and not a["href"].startswith("#"):
+            url = urljoin(roster_url, a["href"])
+            logger.debug("Found %s link: %s", label, url)
+            return url
+
     return None
 
 
+def find_coaches_page_url(roster_html: str | BeautifulSoup, roster_url: str) -> str | None:
+    """
+    Try to find a dedicated 'Coaching Staff' or 'Coaches' page from the roster HTML.
+    If not found via links, try common URL patterns.
+
+    `roster_html` may be a pre-parsed soup (see parse_html).
+    """
+    url = scan_coaches_url_from_html(roster_html, roster_url)
+    if url:
+        return url
+
+    logger.debug("No dedicated coaching staff link found, trying common patterns...")
+    url = guess_coaches_url_from_pattern(roster_url)
+    if not url:
+        logger.debug("Could not determine coaches page URL.")
+    return url
+
+
+def _scan_block_links(links) -> tuple[str, str, str | None]:
+    """
+    Single pass over a coach block's links, given as (href, get_text) pairs.
+
+    Returns (email, phone, bio_href): the first mailto:/tel: values and the
+    first likely bio/profile link. Link text is only read while no bio link
+    has been found yet.
+    """
+    email = ""
+    phone = ""
+    bio_href = None
+    for href, get_text in links:
+        if href.startswith(CONTACT_HREF_PREFIXES):
+            if href.startswith("mailto:"):
+                if not email:
+                    email = normalize_text(href.replace("mailto:", ""))
+            elif not phone:
+                phone = normalize_text(href.replace("tel:", ""))
+
+        if bio_href is None:
+            if BIO_LINK_TEXT_RE.search(normalize_text(get_text())) or BIO_LINK_HREF_RE.search(href):
+                bio_href = href
+    return email, phone, bio_href
+
+
+def _leaf_text(tag) -> str:
+    """
+    normalize_text(tag.get_text()) for label-like tags. The usual single text
+    node is read straight from tag.string, with no list building and join.
+    """
+    s = tag.string
+    # Exact type: comments and script/style strings are NavigableString
+    # subclasses that get_text() leaves out.
+    if type(s) is NavigableString:
+        return normalize_text(s)
+    return normalize_text(tag.get_text())
+
+
 def _extract_photo_url(container, base_url: str | None) -> str:
     """
     Attempt to locate an image tag inside the container and return an absolute URL.
     """
-    img = container.find("img")
+    return _img_photo_url(container.find("img"), base_url)
+
+
+def _img_photo_url(img, base_url: str | None) -> str:
     if not img:
         return ""
 
@@ -182,17 +372,46 @@ def _extract_photo_url(container, base_url: str | None) -> str:
     return urljoin(base_url or "", src)
 
 
-def _enrich_with_bio(coach: dict, bio_href: str | None, base_url: str | None, fetch_bios: bool):
-    """
-    Optionally fetch a coach bio page and attach tenure info.
-    """
-    if not fetch_bios or not bio_href:
-        return
+# Tags the Sidearm block parser reads, keyed by (tag name or None, class).
+SIDEARM_BLOCK_TAGS = {
+    (None, "sidearm-roster-coach-name"): "name",
+    (None, "sidearm-roster-coach-title"): "title",
+    ("h2", None): "h2",
+    ("h3", None): "h3",
+    ("h4", None): "h4",
+    ("img", None): "img",
+}
 
-    bio_url = urljoin(base_url, bio_href) if base_url else bio_href
-    if not bio_url:
-        return
 
+def _index_sidearm_block(block) -> tuple[dict, list]:
+    """
+    One walk over a Sidearm coach block: the first tag for each
+    SIDEARM_BLOCK_TAGS key (what block.find() would return) and every
+    <a href> in document order, instead of a separate subtree search each.
+    """
+    found: dict = {}
+    links = []
+    for el in block.descendants:
+        name = el.name
+        if name is None:
+            continue
+        if name == "a" and el.get("href") is not None:
+            links.append(el)
+        key = SIDEARM_BLOCK_TAGS.get((name, None))
+        if key and key not in found:
+            found[key] = el
+        for cls in el.get("class") or ():
+            key = SIDEARM_BLOCK_TAGS.get((None, cls))
+            if key and key not in found:
+                found[key] = el
+    return found, links
+
+
+def _enrich_with_bio(coaches: list[Coach], bio_url: str):
+    """
+    Fetch one coach bio page and attach its tenure info to every coach that
+    links to it.
+    """
     try:
         bio_html = fetch_html(bio_url)
     except Exception as e:
@@ -200,180 +419,364 @@ def _enrich_with_bio(coach: dict, bio_href: str | None, base_url: str | None, fe
         return
 
     try:
-        bio_soup = BeautifulSoup(bio_html, "html.parser")
-        bio_text = normalize_text(bio_soup.get_text(" ", strip=True))
+        bio_soup = parse_html(bio_html)
+        # extract_tenure_from_text normalizes whitespace itself
+        bio_text = bio_soup.get_text(" ", strip=True)
         start_year, seasons_at_school = extract_tenure_from_text(bio_text)
-        if start_year:
-            coach["start_year"] = start_year
-        if seasons_at_school:
-            coach["seasons_at_school"] = seasons_at_school
-        coach["bio_url"] = bio_url
     except Exception as e:
         logger.debug("Error parsing bio %s: %s", bio_url, e)
+        return
+
+    for coach in coaches:
+        if start_year:
+            coach.start_year = start_year
+        if seasons_at_school:
+            coach.seasons_at_school = seasons_at_school
+        coach.bio_url = bio_url
+
 
+def _bio_executor() -> ThreadPoolExecutor:
+    global _BIO_EXECUTOR
+    if _BIO_EXECUTOR is None:
+        with _BIO_EXECUTOR_LOCK:
+            if _BIO_EXECUTOR is None:
+                _BIO_EXECUTOR = ThreadPoolExecutor(max_workers=BIO_FETCH_WORKERS, thread_name_prefix="coach-bio")
+    return _BIO_EXECUTOR
 
-def parse_coaches_from_html(html: str, base_url: str | None = None, fetch_bios: bool = False) -> list[dict]:
+
+def _enrich_bio_batch(batch: list[tuple[str, list[Coach]]]):
+    for bio_url, coaches in batch:
+        _enrich_with_bio(coaches, bio_url)
+
+
+def _enrich_all_with_bios(pending: list[tuple[Coach, str | None]], base_url: str | None, fetch_bios: bool):
+    """
+    Run _enrich_with_bio once per distinct bio URL in (coach, bio_href) pairs,
+    so a page linked from several coaches is fetched and parsed once.
+
+    Bio pages share the team site's host, so they are split into at most
+    MAX_REQUESTS_PER_HOST batches run on the shared bio pool. Each batch
+    fetches its pages in turn on one worker, reusing that thread's keep-alive
+    session, and a team never ties up more pool threads than it may have
+    requests in flight. fetch_coaches calls this from up to --workers team
+    threads at once, so the pool holds at most BIO_FETCH_WORKERS threads in
+    total; fetch_html's per-host semaphore still caps each host.
+    """
+    if not fetch_bios:
+        return
+
+    coaches_by_bio_url: dict[str, list[Coach]] = {}
+    for coach, bio_href in pending:
+        if not bio_href:
+            continue
+        bio_url = urljoin(base_url, bio_href) if base_url else bio_href
+        if bio_url:
+            coaches_by_bio_url.setdefault(bio_url, []).append(coach)
+    if not coaches_by_bio_url:
+        return
+
+    items = list(coaches_by_bio_url.items())
+    batches = [items[i::MAX_REQUESTS_PER_HOST] for i in range(min(MAX_REQUESTS_PER_HOST, len(items)))]
+    # Wait on every batch; result() re-raises an unexpected worker error here
+    # instead of dropping it with its future.
+    for future in [_bio_executor().submit(_enrich_bio_batch, batch) for batch in batches]:
+        future.result()
+
+
+def _first_email_and_phone(text: str) -> tuple[str, str]:
+    """
+    Return the first email address and phone number in `text` ("" if absent)
+    from a single CONTACT_RE pass.
+    """
+    email = ""
+    phone = ""
+    for m in CONTACT_RE.finditer(text):
+        if m.lastgroup == "email":
+            email = email or m.group(0)
+        else:
+            phone = phone or m.group(0)
+        if email and phone:
+            break
+    return email, phone
+
+
+def _index_sidearm_block_lexbor(block) -> tuple[dict, list]:
+    """
+    _index_sidearm_block for a selectolax node: one traverse() of the block
+    instead of a css() query per field. traverse() starts with the block
+    itself, which BeautifulSoup's descendants (and so the index) leave out.
+    """
+    found: dict = {}
+    links = []
+    nodes = block.traverse(include_text=False)
+    next(nodes, None)
+    for el in nodes:
+        name = el.tag
+        attrs = el.attributes
+        if name == "a" and "href" in attrs:
+            links.append(el)
+        key = SIDEARM_BLOCK_TAGS.get((name, None))
+        if key and key not in found:
+            found[key] = el
+        for cls in (attrs.get("class") or "").split():
+            key = SIDEARM_BLOCK_TAGS.get((None, cls))
+            if key and key not in found:
+                found[key] = el
+    return found, links
+
+
+def _parse_sidearm_coaches_lexbor(html: str, base_url: str | None, fetch_bios: bool) -> list[Coach]:
+    """
+    Sidearm branch of parse_coaches_from_html on a selectolax tree.
+    Mirrors the BeautifulSoup branch field for field.
+    """
+    tree = LexborHTMLParser(html or "")
+    # BeautifulSoup's get_text skips script/style contents; lexbor's text does not.
+    tree.strip_tags(["script", "style"])
+
+    coach_blocks = []
+    seen_blocks: set[int] = set()
+    # Nodes matching several selectors in the list are repeated; keep the first.
+    for block in tree.css(SIDEARM_COACH_SELECTOR):
+        if block.mem_id not in seen_blocks:
+            seen_blocks.add(block.mem_id)
+            coach_blocks.append(block)
+
+    coaches: list[Coach] = []
+    if not coach_blocks:
+        return coaches
+
+    logger.debug("Found %d coach blocks (Sidearm-style).", len(coach_blocks))
+
+    pending_bios: list[tuple[Coach, str | None]] = []
+    for block in coach_blocks:
+        name = ""
+        title = ""
+        tags, links = _index_sidearm_block_lexbor(block)
+
+        name_tag = tags.get("name") or tags.get("h3") or tags.get("h2")
+        if name_tag:
+            name = normalize_text(name_tag.text())
+
+        title_tag = tags.get("title") or tags.get("h4")
+        if title_tag:
+            title = normalize_text(title_tag.text())
+
+        email, phone, bio_href = _scan_block_links(
+            (a.attributes.get("href") or "", a.text) for a in links
+        )
+
+        # The block's full text is only needed when the links left a gap.
+        if not email or not phone:
+            block_text = normalize_text(block.text(separator=" ", strip=True))
+            text_email, text_phone = _first_email_and_phone(block_text)
+            email = email or text_email
+            phone = phone or text_phone
+
+        photo_url = ""
+        img = tags.get("img")
+        if img:
+            src = img.attributes.get("data-src") or img.attributes.get("src")
+            if src:
+                photo_url = urljoin(base_url or "", src)
+
+        if name:
+            coach = Coach(name=name, title=title, email=email, phone=phone, photo_url=photo_url)
+            pending_bios.append((coach, bio_href))
+            coaches.append(coach)
+
+    _enrich_all_with_bios(pending_bios, base_url, fetch_bios)
+    return coaches
+
+
+def _staff_row_contacts(parent):
+    """
+    For a fallback-branch row element, return (row_text, email_match, email, phone)
+    or None when the row is not a staff row with an email address.
+    """
+    row_text = normalize_text(parent.get_text(" ", strip=True))
+    if not STAFF_KEYWORDS_RE.search(row_text):
+        return None
+
+    # One email scan serves both the fallback address and the title split.
+    m_email_in_row = EMAIL_RE.search(row_text)
+
+    email = ""
+    email_tag = parent.find("a", href=MAILTO_HREF_RE)
+    if email_tag and email_tag.get("href"):
+        email = email_tag["href"].split("mailto:")[-1].strip()
+    elif m_email_in_row:
+        email = m_email_in_row.group(0)
+
+    if not email:
+        return None
+
+    phone = ""
+    phone_tag = parent.find("a", href=TEL_ANYWHERE_HREF_RE)
+    if phone_tag and phone_tag.get("href"):
+        phone = phone_tag["href"].split("tel:")[-1].strip()
+    else:
+        m_phone = PHONE_RE.search(row_text)
+        if m_phone:
+            phone = m_phone.group(0)
+
+    return row_text, m_email_in_row, email, phone
+
+
+def _parse_staff_table(table, base_url: str | None) -> list[Coach]:
+    """
+    Parse a coaching-staff table: name and title in the first two cells,
+    email/phone in later cells or mailto:/tel: links.
+    """
+    coaches: list[Coach] = []
+    rows = table.find_all("tr")
+    for row in rows[1:]:  # Skip header row
+        # Cells are the row's direct children; no need to search inside them.
+        cells = row.find_all(["td", "th"], recursive=False)
+        if len(cells) >= 2:
+            # First cell is usually name, second is title
+            name_cell = cells[0]
+            title_cell = cells[1]
+            
+            name = _leaf_text(name_cell)
+            title = _leaf_text(title_cell)
+            
+            # Skip if name looks like header text
+            if name.lower() in {"name", "staff", "title"}:
+                continue
+            
+            # Look for email in remaining cells or row
+            email = ""
+            phone = ""
+            photo_url = _extract_photo_url(row, base_url)
+            for cell in cells[2:]:
+                cell_email, cell_phone = _first_email_and_phone(_leaf_text(cell))
+                if cell_email:
+                    email = cell_email
+                if cell_phone:
+                    phone = cell_phone
+            
+            # Also check for mailto/tel links in any cell
+            if not email:
+                email_tag = row.find("a", href=MAILTO_HREF_RE)
+                if email_tag:
+                    email = email_tag["href"].replace("mailto:", "").strip()
+            if not phone:
+                phone_tag = row.find("a", href=TEL_HREF_RE)
+                if phone_tag:
+                    phone = phone_tag["href"].replace("tel:", "").strip()
+            
+            if name and title:
+                coaches.append(Coach(name=name, title=title, email=email, phone=phone, photo_url=photo_url))
+    return coaches
+
+
+def parse_coaches_from_html(
+    html: str | BeautifulSoup,
+    base_url: str | None = None,
+    fetch_bios: bool = False,
+) -> list[Coach]:
     """
     Best-effort coach scraper.
 
-    Returns a list of dicts: {"name", "title", "email", "phone", "start_year?", "seasons_at_school?", "bio_url?"}
+    Returns a list of Coach records (see Coach.to_dict for the teams.json shape).
     Tenure fields are filled only if `fetch_bios` is True and a coach bio link can be fetched.
+    `html` may be a pre-parsed soup (see parse_html), in which case it is not re-parsed.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    coaches: list[dict] = []
-
-    email_pattern = re.compile(
-        r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}",
-        flags=re.I,
-    )
-    phone_pattern = re.compile(
-        r"\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}",
-        flags=re.I,
-    )
+    is_soup = isinstance(html, BeautifulSoup)
+    use_lexbor = LexborHTMLParser is not None and not is_soup
+    has_sidearm = is_soup or SIDEARM_MARKER_RE.search(html or "") is not None
 
     # ---------- 1) Sidearm-style coach containers ----------
-    coach_blocks = soup.select(
-        ".sidearm-roster-coach, "
-        ".sidearm-roster-coaches li, "
-        "li.sidearm-roster-coach, "
-        "div.sidearm-coach, "
-        "div.coach-card"
-    )
+    if use_lexbor and has_sidearm:
+        coaches = _parse_sidearm_coaches_lexbor(html, base_url, fetch_bios)
+        if coaches:
+            logger.info("Parsed %d coaches from Sidearm-style blocks.", len(coaches))
+            return coaches
+
+    soup = parse_html(html)
+    coaches: list[Coach] = []
+
+    # Without the lexbor pass, the Sidearm branch runs on the BeautifulSoup tree.
+    coach_blocks = [] if use_lexbor or not has_sidearm else SIDEARM_COACH_MATCHER.select(soup)
 
     if coach_blocks:
         logger.debug("Found %d coach blocks (Sidearm-style).", len(coach_blocks))
 
+        pending_bios: list[tuple[Coach, str | None]] = []
         for block in coach_blocks:
             name = ""
             title = ""
-            email = ""
-            phone = ""
+            tags, links = _index_sidearm_block(block)
 
-            name_tag = (
-                block.find(class_="sidearm-roster-coach-name")
-                or block.find("h3")
-                or block.find("h2")
-            )
+            name_tag = tags.get("name") or tags.get("h3") or tags.get("h2")
             if name_tag:
-                name = normalize_text(name_tag.get_text())
+                name = _leaf_text(name_tag)
 
-            title_tag = (
-                block.find(class_="sidearm-roster-coach-title")
-                or block.find("h4")
-            )
+            title_tag = tags.get("title") or tags.get("h4")
             if title_tag:
-                title = normalize_text(title_tag.get_text())
+                title = _leaf_text(title_tag)
 
-            block_text = normalize_text(block.get_text(" ", strip=True))
+            email, phone, bio_href = _scan_block_links((a["href"], a.get_text) for a in links)
 
-            for a in block.find_all("a", href=True):
-                href = a["href"]
-                if href.startswith("mailto:") and not email:
-                    email = normalize_text(href.replace("mailto:", ""))
-                elif href.startswith("tel:") and not phone:
-                    phone = normalize_text(href.replace("tel:", ""))
+            # The block's full text is only needed when the links left a gap.
+            if not email or not phone:
+                block_text = normalize_text(block.get_text(" ", strip=True))
+                text_email, text_phone = _first_email_and_phone(block_text)
+                email = email or text_email
+                phone = phone or text_phone
 
-            if not email:
-                m_email = email_pattern.search(block_text)
-                if m_email:
-                    email = m_email.group(0)
-
-            if not phone:
-                m_phone = phone_pattern.search(block_text)
-                if m_phone:
-                    phone = m_phone.group(0)
-
-            bio_href = _find_bio_href(block)
-            photo_url = _extract_photo_url(block, base_url)
+            photo_url = _img_photo_url(tags.get("img"), base_url)
 
             if name:
-                coach = {
-                    "name": name,
-                    "title": title,
-                    "email": email,
-                    "phone": phone,
-                    "photo_url": photo_url,
-                }
-                _enrich_with_bio(coach, bio_href, base_url, fetch_bios)
+                coach = Coach(name=name, title=title, email=email, phone=phone, photo_url=photo_url)
+                pending_bios.append((coach, bio_href))
                 coaches.append(coach)
 
+        _enrich_all_with_bios(pending_bios, base_url, fetch_bios)
         if coaches:
             logger.info("Parsed %d coaches from Sidearm-style blocks.", len(coaches))
             return coaches
 
     # ---------- 2) Table-based coaching staff (e.g., UTSA) ----------
-    # Look for "Coaching Staff" heading followed by a table
-    for heading in soup.find_all(["h2", "h3", "h4", "h5"]):
-        heading_text = normalize_text(heading.get_text()).lower()
-        if "coaching staff" in heading_text or heading_text == "coaches":
-            # Find table after this heading
-            table = heading.find_next("table")
-            if table:
-                logger.debug("Found coaching staff table after heading: %s", heading_text)
-                rows = table.find_all("tr")
-                for row in rows[1:]:  # Skip header row
-                    cells = row.find_all(["td", "th"])
-                    if len(cells) >= 2:
-                        # First cell is usually name, second is title
-                        name_cell = cells[0]
-                        title_cell = cells[1]
-                        
-                        name = normalize_text(name_cell.get_text())
-                        title = normalize_text(title_cell.get_text())
-                        
-                        # Skip if name looks like header text
-                        if name.lower() in {"name", "staff", "title"}:
-                            continue
-                        
-                        # Look for email in remaining cells or row
-                        email = ""
-                        phone = ""
-                        photo_url = _extract_photo_url(row, base_url)
-                        for cell in cells[2:]:
-                            cell_text = normalize_text(cell.get_text())
-                            if "@" in cell_text:
-                                m_email = email_pattern.search(cell_text)
-                                if m_email:
-                                    email = m_email.group(0)
-                            m_phone = phone_pattern.search(cell_text)
-                            if m_phone:
-                                phone = m_phone.group(0)
-                        
-                        # Also check for mailto/tel links in any cell
-                        if not email:
-                            email_tag = row.find("a", href=lambda h: h and h.startswith("mailto:"))
-                            if email_tag:
-                                email = email_tag["href"].replace("mailto:", "").strip()
-                        if not phone:
-                            phone_tag = row.find("a", href=lambda h: h and h.startswith("tel:"))
-                            if phone_tag:
-                                phone = phone_tag["href"].replace("tel:", "").strip()
-                        
-                        if name and title:
-                            coaches.append({
-                                "name": name,
-                                "title": title,
-                                "email": email,
-                                "phone": phone,
-                                "photo_url": photo_url,
-                            })
-                
-                if coaches:
-                    logger.info("Parsed %d coaches from coaching staff table.", len(coaches))
-                    return coaches
+    # Look for "Coaching Staff" heading followed by a table. Headings and tables
+    # come from one document-order walk, so the first table after a matching
+    # heading is found without a find_next scan per heading.
+    staff_heading = None
+    for el in soup.find_all(["h2", "h3", "h4", "h5", "table"]):
+        if el.name != "table":
+            # Headings between a match and its table cannot change the
+            # outcome, so their text is not read.
+            if staff_heading is None:
+                heading_text = _leaf_text(el).lower()
+                if "coaching staff" in heading_text or heading_text == "coaches":
+                    staff_heading = heading_text
+            continue
+        if staff_heading is None:
+            continue
+
+        logger.debug("Found coaching staff table after heading: %s", staff_heading)
+        staff_heading = None
+        coaches.extend(_parse_staff_table(el, base_url))
+        if coaches:
+            logger.info("Parsed %d coaches from coaching staff table.", len(coaches))
+            return coaches
 
     # ---------- 3) Fallback: staff-row style detection ----------
 
-    coaches = []
-    seen_names: set[str] = set()
+    # Keyed by lowercased name; dicts keep first-seen order, so this is both
+    # the dedupe set and the result list.
+    coaches_by_name: dict[str, Coach] = {}
+    row_cache: dict[int, tuple | None] = {}
+    row_parents: dict[int, Tag | None] = {}
 
     for a in soup.find_all("a", href=True):
         # Skip mailto: and tel: links - they're not names
         href = a.get("href", "")
-        if href.startswith("mailto:") or href.startswith("tel:"):
+        if href.startswith(CONTACT_HREF_PREFIXES):
             continue
         
-        name = normalize_text(a.get_text())
+        name = _leaf_text(a)
         if not name:
             continue
 
@@ -382,57 +785,37 @@ def parse_coaches_from_html(html: str, base_url: str | None = None, fetch_bios:
         # Skip common navigation/accessibility links
         if lower_name in {"image", "name", "title", "email", "phone number"}:
             continue
-        if lower_name.startswith("full bio"):
-            continue
-        if lower_name.startswith("skip to"):
-            continue
-        if "jersey number" in lower_name:
+        if SKIP_LINK_NAME_RE.search(lower_name):
             continue
 
-        if "head coach" in lower_name or "assistant coach" in lower_name:
+        # Repeat links to an already-parsed coach (name, photo, bio) are
+        # dropped before their row is read.
+        if lower_name in coaches_by_name:
             continue
 
-        parent = a.find_parent(["tr", "li", "div", "p"])
+        # Plain name test per ancestor; find_parent() would build a
+        # SoupStrainer and run its generic matcher on every level. Links
+        # wrapped in the same element share a row, so each wrapper's
+        # ancestors are walked once per page.
+        wrapper_key = id(a.parent)
+        if wrapper_key in row_parents:
+            parent = row_parents[wrapper_key]
+        else:
+            parent = next((el for el in a.parents if el.name in STAFF_ROW_TAGS), None)
+            row_parents[wrapper_key] = parent
         if not parent:
             continue
 
-        row_text = normalize_text(parent.get_text(" ", strip=True))
-        row_lower = row_text.lower()
-
-        staff_keywords = [
-            "coach",
-            "coordinator",
-            "operations",
-            "trainer",
-            "strength & conditioning",
-            "support staff",
-            "director of volleyball",
-        ]
-        if not any(kw in row_lower for kw in staff_keywords):
-            continue
-
-        email = ""
-        email_tag = parent.find("a", href=lambda h: h and h.startswith("mailto:"))
-        if email_tag and email_tag.get("href"):
-            email = email_tag["href"].split("mailto:")[-1].strip()
-        else:
-            m_email = email_pattern.search(row_text)
-            if m_email:
-                email = m_email.group(0)
-
-        if not email:
+        # Sibling links (name, bio, photo) share a row, and navigation links
+        # often share one large container; read each row only once.
+        row_key = id(parent)
+        if row_key not in row_cache:
+            row_cache[row_key] = _staff_row_contacts(parent)
+        row = row_cache[row_key]
+        if row is None:
             continue
+        row_text, m_email_in_row, email, phone = row
 
-        phone = ""
-        phone_tag = parent.find("a", href=lambda h: h and "tel:" in h)
-        if phone_tag and phone_tag.get("href"):
-            phone = phone_tag["href"].split("tel:")[-1].strip()
-        else:
-            m_phone = phone_pattern.search(row_text)
-            if m_phone:
-                phone = m_phone.group(0)
-
-        m_email_in_row = email_pattern.search(row_text)
         if m_email_in_row:
             before_email = row_text[: m_email_in_row.start()].strip()
         else:
@@ -443,68 +826,17 @@ def parse_coaches_from_html(html: str, base_url: str | None = None, fetch_bios:
         else:
             title_part = before_email
 
-        title_part = phone_pattern.sub("", title_part)
-        title_part = email_pattern.sub("", title_part)
-        title_part = (
-            title_part
-            .replace("/Volleyball", "")
-            .replace("/volleyball", "")
-        )
-        title_part = re.sub(r"\s+", " ", title_part).strip(" ,;-")
+        title_part = " ".join(TITLE_STRIP_RE.sub("", title_part).split()).strip(" ,;-")
 
         if not title_part:
-            m_title = re.search(r"[^,;]*coach[^,;]*", row_text, flags=re.I)
+            m_title = COACH_IN_ROW_RE.search(row_text)
             if m_title:
-                title_part = m_title.group(0)
-                title_part = phone_pattern.sub("", title_part)
-                title_part = email_pattern.sub("", title_part)
-                title_part = re.sub(r"\s+", " ", title_part).strip(" ,;-")
-
-        key = name.lower()
-        if key in seen_names:
-            continue
-        seen_names.add(key)
+                title_part = " ".join(TITLE_CONTACT_RE.sub("", m_title.group(0)).split()).strip(" ,;-")
 
         photo_url = _extract_photo_url(parent, base_url)
-        coaches.append(
-            {
-                "name": name,
-                "title": title_part,
-                "email": email,
-                "phone": phone,
-                "photo_url": photo_url,
-            }
-        )
+        coaches_by_name[lower_name] = Coach(name=name, title=title_part, email=email, phone=phone, photo_url=photo_url)
 
+    coaches = list(coaches_by_name.values())
     logger.info("Parsed %d coaches via fallback staff-row detection.", len(coaches))
     return coaches
 
-
-def pack_coaches_for_row(coaches: List[Dict[str, str]]) -> Dict[str, str]:
-    """
-    Flatten up to 5 coaches into:
-      coach1_name, coach1_title, coach1_email, coach1_phone, ...
-    """
-    out: Dict[str, str] = {}
-    max_coaches = 5
-
-    for idx in range(1, max_coaches + 1):
-        out[f"coach{idx}_name"] = ""
-        out[f"coach{idx}_title"] = ""
-        out[f"coach{idx}_email"] = ""
-        out[f"coach{idx}_phone"] = ""
-        out[f"coach{idx}_start_year"] = ""
-        out[f"coach{idx}_seasons_at_school"] = ""
-
-    if not coaches:
-        return out
-
-    for idx, c in enumerate(coaches[:max_coaches], start=1):
-        out[f"coach{idx}_name"] = normalize_text(c.get("name", ""))
-        out[f"coach{idx}_title"] = normalize_text(c.get("title", ""))
-        out[f"coach{idx}_email"] = normalize_text(c.get("email", ""))
-        out[f"coach{idx}_phone"] = normalize_text(c.get("phone", ""))
-        out[f"coach{idx}_start_year"] = c.get("start_year", "") or ""
-        out[f"coach{idx}_seasons_at_school"] = c.get("seasons_at_school", "") or ""
-
-    return out
@@ -4,15 +4,28 @@ Helper module for loading and managing cached coaching staff data.
 """
 
 import json
+import mmap
 import os
+import sys
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from .logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# orjson is several times faster than the stdlib decoder and parses straight
+# from a buffer, so the cache file can be memory-mapped instead of read.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 DEFAULT_CACHE_FILE = "settings/coaches_cache.json"
 
+# Per-coach fields packed into the coachN_ columns, in column order.
+COACH_FIELDS = ("name", "title", "email", "phone", "start_year", "seasons_at_school")
+
 
 def load_coaches_cache(cache_file: str = DEFAULT_CACHE_FILE) -> Dict[str, List[Dict]]:
     """
@@ -30,24 +43,41 @@ def load_coaches_cache(cache_file: str = DEFAULT_CACHE_FILE) -> Dict[str, List[D
         >>> for coach in stanford_coaches:
         ...     print(f"{coach['name']} - {coach['title']}")
     """
-    if not os.path.exists(cache_file):
+    try:
+        st = os.stat(cache_file)
+    except OSError:
         logger.warning(f"Coaches cache file not found: {cache_file}")
         logger.info("Run 'python scripts/fetch_coaches.py' to create cache")
         return {}
-    
+
+    return _load_coaches_cache_file(cache_file, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_coaches_cache_file(cache_file: str, mtime_ns: int, size: int) -> Dict[str, List[Dict]]:
+    """
+    Read and parse the cache file. Keyed on mtime/size so repeated loads share
+    one parsed dict (callers must not mutate it) until the file is rewritten.
+    """
     try:
-        with open(cache_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(cache_file, "rb") as f:
+            if orjson is not None:
+                # Parse from the page cache: no read() copy of the whole file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+                    data = orjson.loads(buf)
+            else:
+                data = json.loads(f.read())
         
         generated_at = data.get("generated_at", "unknown")
         teams_data = data.get("teams", {})
         
         logger.info(f"Loaded coaches cache: {len(teams_data)} teams (generated: {generated_at})")
         
-        # Convert to simple dict: team_name -> coaches list
+        # Convert to simple dict: team_name -> coaches list. Keys are interned
+        # so get_coaches_for_team's interned lookups compare by identity.
         cache = {}
         for team_name, team_data in teams_data.items():
-            cache[team_name] = team_data.get("coaches", [])
+            cache[sys.intern(team_name)] = team_data.get("coaches", [])
         
         return cache
         
@@ -70,7 +100,27 @@ def get_coaches_for_team(team_name: str, cache: Optional[Dict] = None) -> List[D
     if cache is None:
         cache = load_coaches_cache()
     
-    return cache.get(team_name, [])
+    # The cache keys are interned; interning the lookup name lets the dict
+    # match them by identity instead of comparing the strings.
+    return cache.get(sys.intern(team_name), [])
+
+
+@lru_cache(maxsize=None)
+def _coach_column_keys(max_coaches: int) -> tuple:
+    """
+    Flat column names coach1_name ... coachN_seasons_at_school, built once per
+    max_coaches instead of formatted on every pack_coaches_for_row call.
+    """
+    return tuple(f"coach{i+1}_{field}" for i in range(max_coaches) for field in COACH_FIELDS)
+
+
+@lru_cache(maxsize=None)
+def _empty_coach_row(max_coaches: int) -> Dict[str, str]:
+    """
+    A fully blank packed row; pack_coaches_for_row copies it and overwrites
+    only the slots that have a coach. Never mutate the returned dict.
+    """
+    return dict.fromkeys(_coach_column_keys(max_coaches), "")
 
 
 def pack_coaches_for_row(coaches: List[Dict], max_coaches: int = 5) -> Dict[str, str]:
@@ -85,26 +135,19 @@ def pack_coaches_for_row(coaches: List[Dict], max_coaches: int = 5) -> Dict[str,
         Dict with keys: coach1_name, coach1_title, coach1_email, coach1_phone,
         coach1_start_year, coach1_seasons_at_school, etc.
     """
-    result = {}
-    
-    for i in range(max_coaches):
-        prefix = f"coach{i+1}"
-        
-        if i < len(coaches):
-            coach = coaches[i]
-            result[f"{prefix}_name"] = coach.get("name", "")
-            result[f"{prefix}_title"] = coach.get("title", "")
-            result[f"{prefix}_email"] = coach.get("email", "")
-            result[f"{prefix}_phone"] = coach.get("phone", "")
-            result[f"{prefix}_start_year"] = coach.get("start_year", "")
-            result[f"{prefix}_seasons_at_school"] = coach.get("seasons_at_school", "")
-        else:
-            # Empty columns for missing coaches
-            result[f"{prefix}_name"] = ""
-            result[f"{prefix}_title"] = ""
-            result[f"{prefix}_email"] = ""
-            result[f"{prefix}_phone"] = ""
-            result[f"{prefix}_start_year"] = ""
-            result[f"{prefix}_seasons_at_school"] = ""
-    
+    # Empty columns for missing coaches come from the prebuilt blank row
+    result = _empty_coach_row(max_coaches).copy()
+    result.update(zip(_coach_column_keys(max_coaches), _coach_values(coaches, max_coaches)))
     return result
+
+
+def _coach_values(coaches: List[Dict], max_coaches: int) -> list:
+    """
+    Field values of the first max_coaches coaches, flattened in column order.
+    Missing keys come out blank.
+    """
+    values = []
+    for coach in coaches[:max_coaches]:
+        values.extend(coach.get(f, "") for f in COACH_FIELDS)
+    return values
+
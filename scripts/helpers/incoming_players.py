@@ -39,6 +39,11 @@ SCHOOL_ALIASES: Dict[str, str] = {
 }
 
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# Trailing "(Club Name)" on a raw incoming-player line
+_CLUB_SUFFIX_RE = re.compile(r"\((.+)\)\s*$")
+
+
 def normalize_school_key(name: str) -> str:
     """
     Normalize a school name into a lowercase, punctuation-stripped key,
@@ -48,8 +53,7 @@ def normalize_school_key(name: str) -> str:
         return ""
 
     key = name.lower()
-    key = re.sub(r"[^a-z0-9]+", " ", key)  # non-alnum -> space
-    key = re.sub(r"\s+", " ", key).strip()  # collapse spaces
+    key = _NON_ALNUM_RE.sub(" ", key).strip()  # non-alnum runs -> one space
 
     return SCHOOL_ALIASES.get(key, key)
 
@@ -106,7 +110,7 @@ def parse_raw_incoming_players(raw: str) -> List[Dict[str, str]]:
 
         # Extract club from parentheses at the end, if present
         club = ""
-        club_match = re.search(r"\((.+)\)\s*$", line)
+        club_match = _CLUB_SUFFIX_RE.search(line)
         if club_match:
             club = club_match.group(1).strip()
             # Remove the "(Club)" part from the working line
@@ -1,6 +1,7 @@
 # rpi_lookup.py
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict
 
 import pandas as pd
@@ -16,69 +17,94 @@ logger = get_logger(__name__)
 
 RPI_URL = "https://www.ncaa.com/rankings/volleyball-women/d1/ncaa-womens-volleyball-rpi"
 
+# Column kind -> header substrings, in the priority used to rename a column
+# that matches more than one kind.
+RPI_COLUMN_KEYWORDS = (
+    ("rank", ("rank",)),
+    ("record", ("record",)),
+    ("team", ("team", "school", "institution")),
+)
+
+
+def _rpi_column_kinds(columns) -> Dict[object, tuple]:
+    """
+    Every column kind each header matches, in RPI_COLUMN_KEYWORDS order,
+    from a single pass over the headers.
+    """
+    kinds = {}
+    for c in columns:
+        lc = str(c).strip().lower()
+        kinds[c] = tuple(
+            kind for kind, keywords in RPI_COLUMN_KEYWORDS
+            if any(kw in lc for kw in keywords)
+        )
+    return kinds
+
 
 def build_rpi_lookup() -> Dict[str, Dict[str, str]]:
     """
     Fetch NCAA RPI table and build a lookup:
       normalized_school_key -> { 'rpi_team_name', 'rpi_rank', 'rpi_record' }
+
+    A successful lookup is cached for the life of the process; treat the
+    returned dict as read-only. On failure an empty dict is returned and the
+    next call tries again.
+    """
+    try:
+        return _fetch_rpi_lookup()
+    except RuntimeError as e:
+        logger.warning("%s", e)
+        return {}
+
+
+@lru_cache(maxsize=1)
+def _fetch_rpi_lookup() -> Dict[str, Dict[str, str]]:
+    """
+    Does the work for build_rpi_lookup. Raises RuntimeError instead of
+    returning an empty lookup so failures are never memoized.
     """
     try:
         headers = {"User-Agent": "Mozilla/5.0 (compatible; rpi-scraper/1.0)"}
         resp = requests.get(RPI_URL, headers=headers, timeout=30)
         resp.raise_for_status()
     except Exception as e:
-        logger.warning("Could not fetch RPI page from %s: %s", RPI_URL, e)
-        return {}
+        raise RuntimeError(f"Could not fetch RPI page from {RPI_URL}: {e}") from e
 
     # Pandas >= 2.2 wants a file-like object for literal HTML
     try:
         tables = pd.read_html(StringIO(resp.text))
     except Exception as e:
-        logger.warning("Could not parse RPI tables via read_html: %s", e)
-        return {}
+        raise RuntimeError(f"Could not parse RPI tables via read_html: {e}") from e
 
     if not tables:
-        logger.warning("No tables found on RPI page.")
-        return {}
+        raise RuntimeError("No tables found on RPI page.")
 
     rpi_df = None
+    rpi_kinds = None
 
     # Try to detect the appropriate table by columns
     for df in tables:
-        cols = [str(c).strip().lower() for c in df.columns]
-        has_rank = any("rank" in c for c in cols)
-        has_record = any("record" in c for c in cols)
-        has_teamish = any(
-            ("team" in c) or ("school" in c) or ("institution" in c)
-            for c in cols
-        )
-        if has_rank and has_record and has_teamish:
-            rpi_df = df
+        kinds = _rpi_column_kinds(df.columns)
+        found = {kind for col_kinds in kinds.values() for kind in col_kinds}
+        if len(found) == len(RPI_COLUMN_KEYWORDS):
+            rpi_df, rpi_kinds = df, kinds
             break
 
     # Fallback: just use the first table
     if rpi_df is None:
         rpi_df = tables[0]
+        rpi_kinds = _rpi_column_kinds(rpi_df.columns)
 
     # Map whatever columns they used into "rank", "record", "team"
-    col_map = {}
-    for c in rpi_df.columns:
-        lc = str(c).strip().lower()
-        if "rank" in lc:
-            col_map[c] = "rank"
-        elif "record" in lc:
-            col_map[c] = "record"
-        elif "team" in lc or "school" in lc or "institution" in lc:
-            col_map[c] = "team"
+    col_map = {c: col_kinds[0] for c, col_kinds in rpi_kinds.items() if col_kinds}
 
     rpi_df = rpi_df.rename(columns=col_map)
 
     if "team" not in rpi_df.columns:
-        logger.warning(
-            "RPI table has no recognizable team/school column. Columns were: %s",
-            list(rpi_df.columns),
+        raise RuntimeError(
+            "RPI table has no recognizable team/school column. "
+            f"Columns were: {list(rpi_df.columns)}"
         )
-        return {}
 
     # Drop rows with no team name
     rpi_df = rpi_df.dropna(subset=["team"])
@@ -119,6 +145,9 @@ def build_rpi_lookup() -> Dict[str, Dict[str, str]]:
             "rpi_record": record,
         }
 
+    if not lookup:
+        raise RuntimeError("RPI table had no team rows.")
+
     logger.info(
         "Built RPI lookup with %d teams from NCAA RPI page %s",
         len(lookup),
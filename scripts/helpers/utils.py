@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import re
-from typing import Any, List, Set
+import threading
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Set
+from urllib.parse import urlsplit
 
 import requests
 
@@ -10,6 +13,19 @@ from .logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Politeness cap when callers fetch from worker threads: at most this many
+# in-flight requests to any one host.
+MAX_REQUESTS_PER_HOST = 2
+
+_HOST_LIMITS: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_LIMITS_LOCK = threading.Lock()
+
+USER_AGENT = "Mozilla/5.0 (compatible; roster-stats-scraper/1.4)"
+
+# One requests.Session per thread: sessions pool keep-alive connections, but
+# are not guaranteed thread-safe when shared across workers.
+_SESSIONS = threading.local()
+
 
 # ===================== GENERIC HELPERS =====================
 
@@ -28,6 +44,17 @@ def excel_unprotect(value: Any) -> str:
     return s
 
 
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
+def slugify(value: str) -> str:
+    """
+    Filename-safe slug: every run of non-alphanumerics becomes one "_",
+    with leading/trailing underscores stripped. Case is preserved.
+    """
+    return _NON_ALNUM_RE.sub("_", value).strip("_")
+
+
 def normalize_text(value: Any) -> str:
     """
     Safely normalize arbitrary text.
@@ -47,27 +74,66 @@ def normalize_text(value: Any) -> str:
     except Exception:
         s = ""
 
-    return " ".join(s.split()).strip()
+    # split() drops leading/trailing whitespace (NBSP and other Unicode
+    # spaces included), so the join is already stripped.
+    return " ".join(s.split())
+
+
+def _host_limit(url: str) -> threading.BoundedSemaphore:
+    host = urlsplit(url).netloc.lower()
+    # dict.get is atomic, so known hosts skip the lock; only a miss takes it
+    # (and re-checks, in case another thread just added the host).
+    sem = _HOST_LIMITS.get(host)
+    if sem is None:
+        with _HOST_LIMITS_LOCK:
+            sem = _HOST_LIMITS.get(host)
+            if sem is None:
+                sem = _HOST_LIMITS[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+    return sem
 
 
+def _session() -> requests.Session:
+    session = getattr(_SESSIONS, "session", None)
+    if session is None:
+        session = _SESSIONS.session = requests.Session()
+        # Set once here rather than passed (and merged) on every request
+        session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+@lru_cache(maxsize=128)
 def fetch_html(url: str) -> str:
+    """
+    GET a page and return its text. Cached per process so repeated URLs
+    (shared staff/bio pages, re-parsed roster pages) skip the network, and
+    sent over a per-thread session so same-host requests reuse connections.
+    """
     logger.info("Fetching HTML: %s", url)
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; roster-stats-scraper/1.4)"}
-    resp = requests.get(url, headers=headers, timeout=30)
+    with _host_limit(url):
+        resp = _session().get(url, timeout=30)
     resp.raise_for_status()
     return resp.text
 
 
+_STANDALONE_DIGITS_RE = re.compile(r"\b\d+\b")
+_DIGITS_RE = re.compile(r"\d+")
+_SCHOOL_KEY_STRIP_RE = re.compile(r"[^a-z0-9\s]")
+
+
+@lru_cache(maxsize=8192)
 def normalize_player_name(name: str) -> str:
     """
     Normalize roster player names:
       - Remove jersey numbers and stray digits.
       - Flip 'Last, First' -> 'First Last'.
+
+    Memoized: the pivot/transfer exports normalize the same name several
+    times per player when joining rosters, stats and transfers.
     """
     s = normalize_text(name)
 
     # Strip trailing standalone digits
-    s = re.sub(r"\b\d+\b", "", s)
+    s = _STANDALONE_DIGITS_RE.sub("", s)
     s = " ".join(s.split())
 
     # If "Last, First" format, flip
@@ -84,7 +150,7 @@ def normalize_school_key(name: str) -> str:
     Normalize school names so small differences still match.
     """
     s = normalize_text(name).lower()
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
+    s = _SCHOOL_KEY_STRIP_RE.sub(" ", s)
     stop_words = {"university", "college", "of", "the"}
     tokens = [t for t in s.split() if t and t not in stop_words]
     return " ".join(tokens)
@@ -99,7 +165,7 @@ def excel_protect_record(val: Any) -> str:
         return ""
     if s.startswith('="'):
         return s
-    if "-" in s and any(ch.isdigit() for ch in s):
+    if "-" in s and _DIGITS_RE.search(s):
         return f'="{s}"'
     return s
 
@@ -116,17 +182,30 @@ def excel_protect_phone(phone: Any) -> str:
 
 # ===================== CLASS NORMALIZATION =====================
 
+_CLASS_STRIP_RE = re.compile(r"[^a-z0-9\s\-]")
+_CLASS_FR_RE = re.compile(r"\bfr\b")
+_CLASS_FY_RE = re.compile(r"\bfy\b")
+_CLASS_SO_RE = re.compile(r"\bso\b")
+_CLASS_JR_RE = re.compile(r"\bjr\b")
+_CLASS_SR_RE = re.compile(r"\bsr\b")
+_CLASS_GR_RE = re.compile(r"\bgr\b")
+
+
+@lru_cache(maxsize=None)
 def normalize_class(raw: str) -> str:
     """
     Normalize the class string to one of:
       Fr, R-Fr, So, R-So, Jr, R-Jr, Sr, R-Sr, Gr, Fifth
+
+    Memoized: rosters only use a handful of distinct class strings, and
+    class_next_year/is_graduating re-normalize the same values per player.
     """
     if not raw:
         return ""
 
     s = normalize_text(raw).lower()
-    s = re.sub(r"[^a-z0-9\s\-]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _CLASS_STRIP_RE.sub(" ", s)
+    s = " ".join(s.split())
 
     # Handle First Year (FY) variations
     if s in ("fy", "fy ", "first year", "first-year", "firstyear"):
@@ -140,17 +219,17 @@ def normalize_class(raw: str) -> str:
     if "redshirt" in s or s.startswith("r "):
         redshirt = True
 
-    if "fresh" in s or re.search(r"\bfr\b", s) or "first year" in s or re.search(r"\bfy\b", s):
+    if "fresh" in s or _CLASS_FR_RE.search(s) or "first year" in s or _CLASS_FY_RE.search(s):
         base = "Fr"
-    elif "soph" in s or re.search(r"\bso\b", s):
+    elif "soph" in s or _CLASS_SO_RE.search(s):
         base = "So"
-    elif "junior" in s or re.search(r"\bjr\b", s):
+    elif "junior" in s or _CLASS_JR_RE.search(s):
         base = "Jr"
-    elif "senior" in s or re.search(r"\bsr\b", s):
+    elif "senior" in s or _CLASS_SR_RE.search(s):
         base = "Sr"
     elif "fifth" in s or "5th" in s or "6th" in s or "sixth" in s:
         base = "Fifth"
-    elif "grad" in s or re.search(r"\bgr\b", s):
+    elif "grad" in s or _CLASS_GR_RE.search(s):
         base = "Gr"
 
     if base in {"Gr", "Fifth"}:
@@ -195,6 +274,31 @@ def is_graduating(class_str: str) -> bool:
 
 # ===================== HEIGHT & POSITION =====================
 
+# 6'2, 6-2, 6 - 02: feet and inches around an apostrophe or a dash
+_HEIGHT_FEET_INCHES_RE = re.compile(r"(\d+)\s*['-]\s*(\d+)")
+# Curly/back quotes become apostrophes and inch marks are dropped, in one pass.
+_HEIGHT_QUOTES_TABLE = str.maketrans({"’": "'", "`": "'", "\"": None})
+_POSITION_SPLIT_RE = re.compile(r"[\/,;]+")
+# Substrings that mark a staff role rather than a playing position; one
+# alternation scans the position once instead of once per keyword.
+STAFF_POSITION_KEYWORDS = (
+    "coach", "assistant", "director", "consultant", "coordinator",
+    "analyst", "trainer", "manager", "intern", "video", "strength",
+    "operations", "development", "technical", "volunteer", "graduate assistant"
+)
+_STAFF_POSITION_RE = re.compile("|".join(map(re.escape, STAFF_POSITION_KEYWORDS)))
+# One pattern per code: its keyword substrings and standalone abbreviations
+# in a single alternation, so each code is one scan of the joined tokens.
+# ("opposite" and "left side" are covered by "opp" and "left".)
+_SETTER_RE = re.compile(r"setter|\bs\b")
+_RIGHT_SIDE_RE = re.compile(r"opp|right side|rightside|\b(?:rs|rh)\b")
+_MIDDLE_RE = re.compile(r"middle|\b(?:mb|mh)\b")
+_OUTSIDE_RE = re.compile(r"outside|pin|left|\b(?:oh|ls)\b")
+_DS_RE = re.compile(r"libero|defensive specialist|\bds\b")
+_UTILITY_RE = re.compile(r"utility|\b(?:utl|uu)\b")
+_NAME_STRIP_RE = re.compile(r"[^a-z\s]")
+
+
 def normalize_height(raw: str) -> str:
     """
     Normalize height into 'F-I' (e.g. '6-2').
@@ -203,23 +307,17 @@ def normalize_height(raw: str) -> str:
     if not s:
         return ""
 
-    s = s.replace("’", "'").replace("`", "'")
-    s = s.replace("\"", "").replace("in", "")
+    s = s.translate(_HEIGHT_QUOTES_TABLE).replace("in", "")
     s = s.strip().lower()
 
-    # 6'2
-    m = re.match(r"(\d+)\s*'\s*(\d+)", s)
-    if not m:
-        # 6-2, 6 - 02
-        m = re.match(r"(\d+)\s*[-]\s*(\d+)", s)
-
+    m = _HEIGHT_FEET_INCHES_RE.match(s)
     if m:
         feet = int(m.group(1))
         inches = int(m.group(2))
         if 0 <= inches < 12 and 4 <= feet <= 7:
             return f"{feet}-{inches}"
 
-    nums = re.findall(r"\d+", s)
+    nums = _DIGITS_RE.findall(s)
     if len(nums) == 2:
         feet = int(nums[0])
         inches = int(nums[1])
@@ -235,22 +333,26 @@ def extract_position_codes(position: str) -> Set[str]:
       S, RS, OH, MB, DS
     Returns empty set if position looks like staff/coach role.
     """
+    return set(_position_codes(position))
+
+
+@lru_cache(maxsize=1024)
+def _position_codes(position: str) -> FrozenSet[str]:
+    """
+    extract_position_codes, memoized: rosters repeat a handful of position
+    labels, so each distinct string is tokenized and matched only once.
+    """
     p_raw = normalize_text(position)
     if not p_raw:
-        return set()
+        return frozenset()
 
     p = p_raw.lower().replace(".", " ").strip()
     
     # Filter out staff positions
-    staff_keywords = [
-        "coach", "assistant", "director", "consultant", "coordinator",
-        "analyst", "trainer", "manager", "intern", "video", "strength",
-        "operations", "development", "technical", "volunteer", "graduate assistant"
-    ]
-    if any(kw in p for kw in staff_keywords):
-        return set()
+    if _STAFF_POSITION_RE.search(p):
+        return frozenset()
     
-    parts = re.split(r"[\/,;]+", p)
+    parts = _POSITION_SPLIT_RE.split(p)
     tokens: List[str] = []
     for part in parts:
         tokens.extend(part.split())
@@ -259,75 +361,59 @@ def extract_position_codes(position: str) -> Set[str]:
     codes: Set[str] = set()
 
     # Setter
-    if "setter" in joined or re.search(r"\bs\b", joined):
+    if _SETTER_RE.search(joined):
         codes.add("S")
 
     # Right side / Opposite / Rightside Hitter
-    if (
-        "opp" in joined 
-        or "opposite" in joined 
-        or "right side" in joined
-        or "rightside" in joined
-        or re.search(r"\brs\b", joined)
-        or re.search(r"\brh\b", joined)
-    ):
+    if _RIGHT_SIDE_RE.search(joined):
         codes.add("RS")
 
     # Middle blocker
-    if "middle" in joined or re.search(r"\bmb\b", joined) or re.search(r"\bmh\b", joined):
+    if _MIDDLE_RE.search(joined):
         codes.add("MB")
 
     # Outside hitter / Left side / Pin
-    if (
-        "outside" in joined 
-        or "pin" in joined 
-        or "left side" in joined
-        or "left" in joined
-        or re.search(r"\boh\b", joined)
-        or re.search(r"\bls\b", joined)
-    ):
+    if _OUTSIDE_RE.search(joined):
         codes.add("OH")
 
     # Defensive specialist / Libero
-    if (
-        "libero" in joined
-        or "defensive specialist" in joined
-        or re.search(r"\bds\b", joined)
-        or any(t in {"l", "lib"} for t in tokens)
-    ):
+    if _DS_RE.search(joined) or any(t in {"l", "lib"} for t in tokens):
         codes.add("DS")
     
     # Handle special combined positions
     # "Utility" = OH/DS, "UU" = OH/DS
-    if "utility" in joined or re.search(r"\butl\b", joined) or re.search(r"\buu\b", joined):
+    if _UTILITY_RE.search(joined):
         codes.add("OH")
         codes.add("DS")
     
     # "Opposite/Setter" = S/RS
-    if ("opposite" in joined or "opp" in joined) and "setter" in joined:
+    if "opp" in joined and "setter" in joined:
         codes.add("S")
         codes.add("RS")
     
     # "Opposite Hitter/Middle Blocker" = RS/MB (already handled by individual checks above)
     # But explicitly handle if we see both in the string
-    if ("opposite" in joined or "opp" in joined) and "middle" in joined:
+    if "opp" in joined and "middle" in joined:
         codes.add("RS")
         codes.add("MB")
 
-    return codes
+    return frozenset(codes)
 
 
+@lru_cache(maxsize=8192)
 def canonical_name(name: str) -> str:
     """
     Canonicalize names for joining stats:
       - strip punctuation
       - lowercase
       - sort unique tokens
+
+    Memoized like normalize_player_name.
     """
     if not name:
         return ""
     s = normalize_text(name).lower()
-    s = re.sub(r"[^a-z\s]", " ", s)
+    s = _NAME_STRIP_RE.sub(" ", s)
     tokens = [t for t in s.split() if t]
     if not tokens:
         return ""
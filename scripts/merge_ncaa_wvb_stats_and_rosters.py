@@ -11,10 +11,15 @@ import argparse
 from pathlib import Path
 import pandas as pd
 import json
-import re
+import sys
 
 # Root paths for matching photos and teams metadata
 ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.helpers.utils import slugify
+
 TEAMS_JSON = ROOT_DIR / "settings" / "teams.json"
 PLAYER_PHOTOS_DIR = ROOT_DIR / "assets" / "player_photos"
 SCHOOL_LOOKUP: dict[str, str] = {}
@@ -107,7 +112,7 @@ def merge_files(stats_path: Path, roster_path: Path, output_path: Path) -> None:
                 teams = json.loads(TEAMS_JSON.read_text())
                 for t in teams:
                     canonical = t.get("team") or t.get("short_name") or ""
-                    canonical_slug = re.sub(r"[^A-Za-z0-9]+", "_", canonical).strip("_")
+                    canonical_slug = slugify(canonical)
                     aliases = t.get("team_name_aliases") or []
                     for alias in [canonical] + aliases:
                         if alias:
@@ -115,18 +120,19 @@ def merge_files(stats_path: Path, roster_path: Path, output_path: Path) -> None:
             except Exception:
                 team_aliases = {}
 
-        def _slugify(s: str) -> str:
-            s = re.sub(r"[^A-Za-z0-9]+", "_", s)
-            s = re.sub(r"_+", "_", s).strip("_")
-            return s
+        # Every player row of a team resolves the same alias and slug; do it
+        # once per team name.
+        team_keys: dict[str, str] = {}
 
         def find_photo(team: str, player: str) -> str:
             if not photo_index:
                 return ""
-            # Use school/team field first, fall back to team alias
-            team_lookup = team_aliases.get(team.lower(), team)
-            team_key = _slugify(team_lookup)
-            player_key = _slugify(player)
+            team_key = team_keys.get(team)
+            if team_key is None:
+                # Use school/team field first, fall back to team alias
+                team_lookup = team_aliases.get(team.lower(), team)
+                team_key = team_keys[team] = slugify(team_lookup)
+            player_key = slugify(player)
             if not team_key or not player_key:
                 return ""
 
@@ -1,6 +1,8 @@
 import atexit
+import json
 import random
 import time
+from functools import lru_cache
 from typing import Optional, List
 
 from io import StringIO
@@ -18,6 +20,21 @@ except ImportError:  # pragma: no cover - optional dependency
     sync_playwright = None  # type: ignore
     PlaywrightTimeoutError = Exception  # type: ignore
 
+# BeautifulSoup tree builder: the C-based lxml parser when installed (pandas'
+# read_html already relies on it), else the pure-Python stdlib parser.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - optional dependency
+    HTML_PARSER = "html.parser"
+
+# selectolax's lexbor parser handles the select-and-read-text roster/link
+# extraction several times faster than BeautifulSoup.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
+
 
 # --------- CONFIG ---------
 
@@ -41,6 +58,34 @@ _PLAYWRIGHT = None
 _BROWSER = None
 _PAGE = None
 _LAST_HTTP_TS = 0.0
+_HTTP_SESSION: requests.Session | None = None
+
+
+BASE_REQUEST_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Cache-Control": "no-cache",
+}
+
+
+@lru_cache(maxsize=4)
+def _read_cookie_file(path: Path, mtime_ns: int) -> str:
+    """Cookie header from COOKIE_FILE, re-read only when the file changes."""
+    return path.read_text(encoding="utf-8").strip()
+
+
+def _request_headers() -> dict:
+    """Browser-like headers (plus optional Cookie) shared by Playwright and requests."""
+    headers = {"User-Agent": REQUEST_USER_AGENT, **BASE_REQUEST_HEADERS}
+    cookie_header = COOKIE_STR
+    if not cookie_header and COOKIE_FILE:
+        try:
+            cookie_header = _read_cookie_file(COOKIE_FILE, COOKIE_FILE.stat().st_mtime_ns)
+        except FileNotFoundError:
+            cookie_header = ""
+    if cookie_header:
+        headers["Cookie"] = cookie_header
+    return headers
 
 
 def _ensure_playwright_page():
@@ -57,18 +102,7 @@ def _ensure_playwright_page():
         return _PAGE
     _PLAYWRIGHT = sync_playwright().start()
     _BROWSER = _PLAYWRIGHT.chromium.launch(headless=HEADLESS)
-    extra_headers = {
-        "User-Agent": REQUEST_USER_AGENT,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Cache-Control": "no-cache",
-    }
-    cookie_header = COOKIE_STR or (
-        COOKIE_FILE.read_text(encoding="utf-8").strip() if COOKIE_FILE and COOKIE_FILE.exists() else ""
-    )
-    if cookie_header:
-        extra_headers["Cookie"] = cookie_header
-    context = _BROWSER.new_context(user_agent=REQUEST_USER_AGENT, extra_http_headers=extra_headers)
+    context = _BROWSER.new_context(user_agent=REQUEST_USER_AGENT, extra_http_headers=_request_headers())
     _PAGE = context.new_page()
     return _PAGE
 
@@ -99,6 +133,14 @@ def _human_pause() -> None:
     time.sleep(random.uniform(low, high))
 
 
+def _http_session() -> requests.Session:
+    """Shared requests.Session for the HTTP fallback, so fetches reuse keep-alive connections."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        _HTTP_SESSION = requests.Session()
+    return _HTTP_SESSION
+
+
 def _rate_limit_requests() -> None:
     """Enforce a max requests/sec when using plain HTTP (no Playwright)."""
     global _LAST_HTTP_TS
@@ -203,28 +245,208 @@ def _get_html(url: str) -> str:
 
     # Fallback: simple HTTP GET (rate-limited)
     _rate_limit_requests()
-    headers = {
-        "User-Agent": REQUEST_USER_AGENT,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Cache-Control": "no-cache",
-    }
-    cookie_header = COOKIE_STR or (
-        COOKIE_FILE.read_text(encoding="utf-8").strip() if COOKIE_FILE and COOKIE_FILE.exists() else ""
-    )
-    if cookie_header:
-        headers["Cookie"] = cookie_header
-    resp = requests.get(url, timeout=TIMEOUT, headers=headers)
+    resp = _http_session().get(url, timeout=TIMEOUT, headers=_request_headers())
     resp.raise_for_status()
     return resp.text
 
 
+def _make_soup(html: str, tables_only: bool = False):
+    """
+    Parse HTML with BeautifulSoup using HTML_PARSER.
+    With tables_only, only <table> subtrees are built (SoupStrainer), skipping
+    the navigation and script markup that dominates NCAA pages.
+    Raises ImportError if bs4 is not installed.
+    """
+    from bs4 import BeautifulSoup, SoupStrainer  # type: ignore
+
+    parse_only = SoupStrainer("table") if tables_only else None
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+
+PLAYER_LINK_SELECTOR = "table a[href^='/players/']"
+
+
+@lru_cache(maxsize=None)
+def _player_link_matcher():
+    """
+    PLAYER_LINK_SELECTOR compiled once with soupsieve (bs4's CSS engine)
+    rather than re-resolved by soup.select() on every page.
+    """
+    import soupsieve  # type: ignore
+
+    return soupsieve.compile(PLAYER_LINK_SELECTOR)
+
+
+class _LexborTables:
+    """
+    selectolax access to the NCAA stats/roster tables for _stats_rows and
+    _roster_rows. Mirrors _Bs4Tables method for method.
+    """
+
+    @staticmethod
+    def parse(html: str):
+        return LexborHTMLParser(html)
+
+    @staticmethod
+    def _clean(table):
+        # bs4's get_text skips script/style text; drop them once for the whole
+        # table rather than per cell.
+        if table is not None:
+            table.strip_tags(["script", "style"])
+        return table
+
+    @staticmethod
+    def stats_table(root):
+        return _LexborTables._clean(root.css_first("table#stat_grid") or root.css_first("table"))
+
+    @staticmethod
+    def roster_table(root):
+        # Roster table uses specific id rosters_form_players_*; pick the one with tbody rows.
+        for t in root.css('table[id^="rosters_form_players_"]'):
+            tbody = t.css_first("tbody")
+            if tbody and tbody.css_first("tr"):
+                return _LexborTables._clean(t)
+        return _LexborTables.stats_table(root)
+
+    @staticmethod
+    def tbody(table):
+        return table.css_first("tbody") or table
+
+    @staticmethod
+    def header_texts(table) -> list[str]:
+        return [th.text(strip=True) for th in table.css("th")]
+
+    @staticmethod
+    def row_cells(node):
+        """<td> cells of each <tr> under node, skipping rows without any."""
+        for tr in node.css("tr"):
+            cells = tr.css("td")
+            if cells:
+                yield cells
+
+    @staticmethod
+    def text(cell) -> str:
+        return cell.text(strip=True)
+
+    @staticmethod
+    def first_link(cell) -> tuple[str, str]:
+        """(href, text) of the cell's first <a>, or ("", "") without one."""
+        link = cell.css_first("a")
+        if not link:
+            return "", ""
+        return link.attributes.get("href") or "", link.text(strip=True)
+
+
+class _Bs4Tables:
+    """
+    BeautifulSoup access to the NCAA stats/roster tables; parse returns None
+    when bs4 is not installed.
+    """
+
+    @staticmethod
+    def parse(html: str):
+        try:
+            return _make_soup(html, tables_only=True)
+        except ImportError:
+            return None
+
+    @staticmethod
+    def stats_table(root):
+        return root.find("table", id="stat_grid") or root.find("table")
+
+    @staticmethod
+    def roster_table(root):
+        # Roster table uses specific id rosters_form_players_*; pick the one with tbody rows.
+        for t in root.find_all("table", id=lambda x: x and x.startswith("rosters_form_players_")):
+            tbody = t.find("tbody")
+            if tbody and tbody.find("tr"):
+                return t
+        return _Bs4Tables.stats_table(root)
+
+    @staticmethod
+    def tbody(table):
+        return table.find("tbody") or table
+
+    @staticmethod
+    def header_texts(table) -> list[str]:
+        return [th.get_text(strip=True) for th in table.find_all("th")]
+
+    @staticmethod
+    def row_cells(node):
+        """<td> cells of each <tr> under node, skipping rows without any."""
+        for tr in node.find_all("tr"):
+            cells = tr.find_all("td")
+            if cells:
+                yield cells
+
+    @staticmethod
+    def text(cell) -> str:
+        return cell.get_text(strip=True)
+
+    @staticmethod
+    def first_link(cell) -> tuple[str, str]:
+        """(href, text) of the cell's first <a>, or ("", "") without one."""
+        link = cell.find("a")
+        if not link:
+            return "", ""
+        return link.get("href", ""), link.get_text(strip=True)
+
+
+def _table_backend():
+    return _LexborTables if LexborHTMLParser is not None else _Bs4Tables
+
+
+def _player_id_from_href(href: str) -> Optional[str]:
+    """The <id> of a /players/<id> link, or None for any other href."""
+    if not href.startswith("/players/"):
+        return None
+    return href.rstrip("/").split("/")[-1]
+
+
+def _stats_rows(html: str, backend=None):
+    """
+    Stats table cells: (headers, rows), or None if there is no table (or the
+    backend's parser is not installed). A Player cell linking to
+    /players/<id> yields the id, then the name.
+    """
+    backend = backend or _table_backend()
+    root = backend.parse(html)
+    if root is None:
+        return None
+    table = backend.stats_table(root)
+    if not table:
+        return None
+
+    headers = backend.header_texts(table)
+    rows = []
+    for cells in backend.row_cells(table):
+        row = []
+        for td in cells:
+            # If this cell is the Player cell, extract the ID from the link
+            href, link_text = backend.first_link(td)
+            player_id = _player_id_from_href(href)
+            if player_id is not None:
+                row.append(player_id)
+                row.append(link_text)
+            else:
+                row.append(backend.text(td))
+        rows.append(row)
+    return headers, rows
+
+
 def _extract_player_table_from_html(html: str) -> pd.DataFrame:
     """
     Find the table that has a 'Player' column. This mirrors the R code that
     selects the second table on the page, but is a bit more robust.
     """
-    tables = pd.read_html(StringIO(html))
+    # Only tables whose text mentions "Player" can have that column, so let
+    # read_html skip building frames for the rest of the page's tables.
+    try:
+        tables = pd.read_html(StringIO(html), match="Player")
+    except (ValueError, ImportError):
+        # No such table (pandas then retries with its bs4/html5lib flavor,
+        # which may not be installed); the manual parse below handles it.
+        tables = []
     for t in tables:
         if "Player" in t.columns:
             if not t.empty:
@@ -235,40 +457,16 @@ def _extract_player_table_from_html(html: str) -> pd.DataFrame:
             # If the table exists but is empty, fall through to manual parsing.
 
     # Fallback: parse manually in case pandas misses it or returns empty
-    try:
-        from bs4 import BeautifulSoup  # type: ignore
-    except ImportError:
+    parsed = _stats_rows(html)
+    if parsed is None:
         raise ValueError("No table with a 'Player' column found on page.")
+    headers, rows = parsed
 
-    soup = BeautifulSoup(html, "html.parser")
-    table = soup.find("table", id="stat_grid") or soup.find("table")
-    if not table:
-        raise ValueError("No table with a 'Player' column found on page.")
-
-    headers = [th.get_text(strip=True) for th in table.find_all("th")]
     # Insert PlayerID column immediately before Player if present
     if "Player" in headers:
         player_idx = headers.index("Player")
         headers.insert(player_idx, "PlayerID")
 
-    rows = []
-    for tr in table.find_all("tr"):
-        cells = tr.find_all("td")
-        if not cells:
-            continue
-        row = []
-        for td in cells:
-            # If this cell is the Player cell, extract the ID from the link
-            link = td.find("a")
-            if link and link.get("href", "").startswith("/players/"):
-                href = link["href"]
-                player_id = href.rstrip("/").split("/")[-1]
-                row.append(player_id)
-                row.append(link.get_text(strip=True))
-            else:
-                row.append(td.get_text(strip=True))
-        rows.append(row)
-
     if not rows or "Player" not in headers:
         raise ValueError("No table with a 'Player' column found on page.")
 
@@ -281,20 +479,28 @@ def _inject_player_ids_from_links(df: pd.DataFrame, html: str) -> pd.DataFrame:
     If the HTML contains player links (/players/<id>), inject a PlayerID column
     immediately before Player, preserving order.
     """
-    try:
-        from bs4 import BeautifulSoup  # type: ignore
-    except ImportError:
+    # Plain substring check first: pages without player links skip the parse.
+    if "Player" not in df.columns or "/players/" not in html:
         return df
 
-    if "Player" not in df.columns:
-        return df
+    if LexborHTMLParser is not None:
+        links = [
+            (link.attributes.get("href") or "", link.text(strip=True))
+            for link in LexborHTMLParser(html).css(PLAYER_LINK_SELECTOR)
+        ]
+    else:
+        try:
+            soup = _make_soup(html, tables_only=True)
+        except ImportError:
+            return df
+        links = [
+            (link.get("href", ""), link.get_text(strip=True))
+            for link in _player_link_matcher().select(soup)
+        ]
 
-    soup = BeautifulSoup(html, "html.parser")
-    links = soup.select("table a[href^='/players/']")
     id_map: dict[str, str] = {}
-    for link in links:
-        pid = link.get("href", "").rstrip("/").split("/")[-1]
-        name = link.get_text(strip=True)
+    for href, name in links:
+        pid = href.rstrip("/").split("/")[-1]
         if pid and name:
             id_map[name] = pid
 
@@ -306,52 +512,46 @@ def _inject_player_ids_from_links(df: pd.DataFrame, html: str) -> pd.DataFrame:
     return df
 
 
-def _extract_roster_table_from_html(html: str) -> Optional[pd.DataFrame]:
+def _roster_rows(html: str, backend=None):
     """
-    Extract roster info (Name, Hometown, High School, etc.) with PlayerID from links.
+    Roster table cells: (headers, name_idx, rows_data), or None if there is
+    no table (or the backend's parser is not installed). The Name cell yields
+    its /players/<id> link id (None without one), then the name.
     """
-    try:
-        from bs4 import BeautifulSoup  # type: ignore
-    except ImportError:
+    backend = backend or _table_backend()
+    root = backend.parse(html)
+    if root is None:
         return None
-
-    soup = BeautifulSoup(html, "html.parser")
-    # Roster table uses specific id rosters_form_players_*; pick the one with tbody rows.
-    candidates = soup.find_all("table", id=lambda x: x and x.startswith("rosters_form_players_"))
-    table = None
-    for t in candidates:
-        tbody = t.find("tbody")
-        if tbody and tbody.find("tr"):
-            table = t
-            break
-    if table is None:
-        table = soup.find("table", id="stat_grid") or soup.find("table")
+    table = backend.roster_table(root)
     if not table:
         return None
 
-    tbody = table.find("tbody") or table
-    header_cells = table.find_all("th")
-    headers = [th.get_text(strip=True) for th in header_cells] if header_cells else []
+    headers = backend.header_texts(table)
     name_idx = headers.index("Name") if "Name" in headers else None
 
     rows_data = []
-    for tr in tbody.find_all("tr"):
-        cells = tr.find_all("td")
-        if not cells:
-            continue
+    for cells in backend.row_cells(backend.tbody(table)):
         row = []
         for idx, td in enumerate(cells):
-            text = td.get_text(strip=True)
+            text = backend.text(td)
             if name_idx is not None and idx == name_idx:
-                link = td.find("a")
-                pid = None
-                if link and link.get("href", "").startswith("/players/"):
-                    pid = link.get("href", "").rstrip("/").split("/")[-1]
-                row.append(pid)
+                href, _ = backend.first_link(td)
+                row.append(_player_id_from_href(href))
                 row.append(text)
             else:
                 row.append(text)
         rows_data.append(row)
+    return headers, name_idx, rows_data
+
+
+def _extract_roster_table_from_html(html: str) -> Optional[pd.DataFrame]:
+    """
+    Extract roster info (Name, Hometown, High School, etc.) with PlayerID from links.
+    """
+    parsed = _roster_rows(html)
+    if parsed is None:
+        return None
+    headers, name_idx, rows_data = parsed
 
     if not rows_data:
         return None
@@ -404,6 +604,46 @@ def _extract_roster_table_from_html(html: str) -> Optional[pd.DataFrame]:
     return df[existing]
 
 
+class _NoRosterTable(Exception):
+    """Raised by _cached_roster_df when a roster page has no roster table."""
+
+
+def _fetch_roster_df(team_id: str, debug_dir: Optional[Path] = None) -> Optional[pd.DataFrame]:
+    """
+    Fetch and parse the NCAA roster page for a team once per run.
+
+    Both the stats join and the roster export need this page; caching it
+    avoids a second (human-paced) browser fetch per team. Callers must not
+    mutate the returned frame in place. Returns None when the page has no
+    roster table (e.g. a challenge or blocked page); that outcome is not
+    cached, so a later call fetches the page again.
+    """
+    try:
+        return _cached_roster_df(team_id, debug_dir)
+    except _NoRosterTable:
+        return None
+
+
+# Sized above the ~350 D1 teams: the stats pass fills the cache and the
+# roster pass reads it back in the same order, so an LRU smaller than one
+# division would miss on every lookup.
+@lru_cache(maxsize=512)
+def _cached_roster_df(team_id: str, debug_dir: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Does the work for _fetch_roster_df. Raises _NoRosterTable instead of
+    returning None so a failed parse is never memoized.
+    """
+    roster_url = f"https://stats.ncaa.org/teams/{team_id}/roster"
+    roster_html = _get_html(roster_url)
+    if debug_dir:
+        debug_dir.mkdir(parents=True, exist_ok=True)
+        (debug_dir / f"{team_id}_roster.html").write_text(roster_html, encoding="utf-8")
+    roster_df = _extract_roster_table_from_html(roster_html)
+    if roster_df is None:
+        raise _NoRosterTable(roster_url)
+    return roster_df
+
+
 def fetch_team_player_season_stats(
     teams_df: pd.DataFrame,
     team_id: str,
@@ -487,13 +727,8 @@ def fetch_team_player_season_stats(
 
     roster_df = None
     if year_for_roster >= 2024:
-        roster_url = f"https://stats.ncaa.org/teams/{team_id}/roster"
         try:
-            roster_html = _get_html(roster_url)
-            if debug_dir:
-                debug_dir.mkdir(parents=True, exist_ok=True)
-                (debug_dir / f"{team_id}_roster.html").write_text(roster_html, encoding="utf-8")
-            roster_df = _extract_roster_table_from_html(roster_html)
+            roster_df = _fetch_roster_df(team_id, debug_dir)
         except Exception as e:
             print(f"[WARN] Could not fetch/join roster for team_id={team_id}: {e}")
             roster_df = None
@@ -588,13 +823,8 @@ def fetch_team_roster(
     team_name = team_meta["team_name"]
     season_label = f"{team_meta['yr']}-{team_meta['yr'] + 1}"
 
-    roster_url = f"https://stats.ncaa.org/teams/{team_id}/roster"
     try:
-        roster_html = _get_html(roster_url)
-        if debug_dir:
-            debug_dir.mkdir(parents=True, exist_ok=True)
-            (debug_dir / f"{team_id}_roster.html").write_text(roster_html, encoding="utf-8")
-        roster_df = _extract_roster_table_from_html(roster_html)
+        roster_df = _fetch_roster_df(str(team_id), debug_dir)
     except Exception as e:
         print(f"[WARN] Could not fetch roster for team_id={team_id}: {e}")
         return None
@@ -602,6 +832,8 @@ def fetch_team_roster(
     if roster_df is None or roster_df.empty:
         return None
 
+    roster_df = roster_df.copy()
+
     roster_df.insert(0, "Season", season_label)
     roster_df.insert(1, "TeamID", str(team_id))
     roster_df.insert(2, "Team", team_name)
@@ -651,8 +883,13 @@ if __name__ == "__main__":
     if args.team_id:
         target_team_ids.extend([str(tid) for tid in args.team_id])
     if args.team:
+        # Exact names resolve through one dict built from the season's teams;
+        # only ambiguous or partial names fall back to find_team_id's scan.
+        season = teams[teams["yr"] == YEAR]
+        unique_names = season.drop_duplicates("team_name", keep=False)
+        team_id_by_name = dict(zip(unique_names["team_name"], unique_names["team_id"].astype(str)))
         for name in args.team:
-            tid = find_team_id(teams, name, YEAR)
+            tid = team_id_by_name.get(name) or find_team_id(teams, name, YEAR)
             target_team_ids.append(tid)
 
     # Resolve output paths up front
@@ -17,13 +17,24 @@ import re
 import time
 import os
 import html
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from urllib.parse import urlparse
 from typing import Optional
 
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
 
+# Niche pages are large; the C-based lxml tree builder parses them several
+# times faster than the stdlib parser, which remains the fallback.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - optional dependency
+    HTML_PARSER = "html.parser"
+
 ROOT = Path(__file__).resolve().parent.parent
 TEAMS_PATH = ROOT / "settings" / "teams.json"
 HEADERS = {
@@ -32,6 +43,7 @@ HEADERS = {
 COOKIE_STR: Optional[str] = None
 BROWSER_PROVIDER: Optional[str] = None
 BROWSER = None
+BROWSER_DRIVER = None
 BROWSER_CTX = None
 BROWSER_PAGE = None
 FORCE_BROWSER = False
@@ -45,7 +57,7 @@ def log(msg: str):
 
 # ------------------------- Browser management -------------------------
 def close_browser():
-    global BROWSER, BROWSER_CTX, BROWSER_PAGE
+    global BROWSER, BROWSER_DRIVER, BROWSER_CTX, BROWSER_PAGE
     try:
         if BROWSER_CTX:
             BROWSER_CTX.close()
@@ -56,17 +68,37 @@ def close_browser():
             BROWSER.close()
     except Exception:
         pass
+    try:
+        if BROWSER_DRIVER:
+            BROWSER_DRIVER.stop()
+    except Exception:
+        pass
     BROWSER = None
+    BROWSER_DRIVER = None
     BROWSER_CTX = None
     BROWSER_PAGE = None
 
 
+def _open_browser_page():
+    """Open a fresh context + page on the already-launched BROWSER."""
+    global BROWSER_CTX, BROWSER_PAGE
+    ctx_headers = {"Accept-Language": "en-US,en;q=0.9"}
+    if COOKIE_STR:
+        ctx_headers["Cookie"] = COOKIE_STR
+    BROWSER_CTX = BROWSER.new_context(user_agent=HEADERS["User-Agent"], extra_http_headers=ctx_headers)
+    if COOKIE_STR:
+        # domain set per-visit in browser_fetch
+        BROWSER_CTX._extra_cookies = COOKIE_STR  # stash string for later domain application
+    BROWSER_PAGE = BROWSER_CTX.new_page()
+    return BROWSER_PAGE
+
+
 def ensure_browser(headless: bool = True, proxy: Optional[str] = None):
     """
     Lazily create or return a shared browser page (playwright > undetected).
     Keeps the window open for visibility in headful mode.
     """
-    global BROWSER_PROVIDER, BROWSER, BROWSER_CTX, BROWSER_PAGE
+    global BROWSER_PROVIDER, BROWSER, BROWSER_DRIVER
     if BROWSER_PAGE:
         try:
             _ = BROWSER_PAGE.title()
@@ -74,6 +106,21 @@ def ensure_browser(headless: bool = True, proxy: Optional[str] = None):
         except Exception:
             pass  # will recreate
 
+    # Only the page/context died: keep the running Chromium and open a new
+    # context on it rather than paying for another browser launch.
+    if BROWSER:
+        try:
+            if BROWSER.is_connected():
+                try:
+                    BROWSER_CTX.close()
+                except Exception:
+                    pass
+                return _open_browser_page()
+        except Exception as e:
+            if VERBOSE:
+                print(f"[browser] reopening page failed, relaunching: {e}")
+        close_browser()
+
     provider = None
     if PLAYWRIGHT_AVAILABLE:
         provider = "playwright"
@@ -82,15 +129,11 @@ def ensure_browser(headless: bool = True, proxy: Optional[str] = None):
     else:
         return None
 
-    if provider == "playwright":
-        with sync_playwright() as p:
-            # NOTE: cannot use context manager return outside; so we need to launch directly
-            pass
-    # We can't use a context manager with return; implement explicit open below
+    # Started explicitly (not as a context manager) so the browser outlives this call
     if provider == "playwright":
         try:
             import playwright.sync_api as psa
-            p = psa.sync_playwright().start()
+            BROWSER_DRIVER = p = psa.sync_playwright().start()
             launch_args = {
                 "headless": headless,
                 "args": ["--disable-blink-features=AutomationControlled", "--no-sandbox"],
@@ -98,17 +141,8 @@ def ensure_browser(headless: bool = True, proxy: Optional[str] = None):
             if proxy:
                 launch_args["proxy"] = {"server": proxy}
             BROWSER = p.chromium.launch(**launch_args)
-            ctx_headers = {"Accept-Language": "en-US,en;q=0.9"}
-            if COOKIE_STR:
-                ctx_headers["Cookie"] = COOKIE_STR
-            BROWSER_CTX = BROWSER.new_context(user_agent=HEADERS["User-Agent"], extra_http_headers=ctx_headers)
-            if COOKIE_STR:
-                cookies = []
-                # domain set per-visit in browser_fetch
-                BROWSER_CTX._extra_cookies = COOKIE_STR  # stash string for later domain application
-            BROWSER_PAGE = BROWSER_CTX.new_page()
             BROWSER_PROVIDER = "playwright"
-            return BROWSER_PAGE
+            return _open_browser_page()
         except Exception as e:
             if VERBOSE:
                 print(f"[browser] playwright launch failed: {e}")
@@ -117,7 +151,7 @@ def ensure_browser(headless: bool = True, proxy: Optional[str] = None):
 
     if provider == "undetected":
         try:
-            p = up.sync_playwright().start()  # type: ignore
+            BROWSER_DRIVER = p = up.sync_playwright().start()  # type: ignore
             launch_args = {
                 "headless": headless,
                 "args": ["--disable-blink-features=AutomationControlled", "--no-sandbox"],
@@ -125,15 +159,8 @@ def ensure_browser(headless: bool = True, proxy: Optional[str] = None):
             if proxy:
                 launch_args["proxy"] = {"server": proxy}
             BROWSER = p.chromium.launch(**launch_args)
-            ctx_headers = {"Accept-Language": "en-US,en;q=0.9"}
-            if COOKIE_STR:
-                ctx_headers["Cookie"] = COOKIE_STR
-            BROWSER_CTX = BROWSER.new_context(user_agent=HEADERS["User-Agent"], extra_http_headers=ctx_headers)
-            if COOKIE_STR:
-                BROWSER_CTX._extra_cookies = COOKIE_STR  # stash
-            BROWSER_PAGE = BROWSER_CTX.new_page()
             BROWSER_PROVIDER = "undetected"
-            return BROWSER_PAGE
+            return _open_browser_page()
         except Exception as e:
             if VERBOSE:
                 print(f"[browser] undetected launch failed: {e}")
@@ -143,6 +170,18 @@ def ensure_browser(headless: bool = True, proxy: Optional[str] = None):
     return None
 
 
+@lru_cache(maxsize=None)
+def _cookie_pairs(cookie_str: str) -> tuple[tuple[str, str], ...]:
+    """Split a raw Cookie header into (name, value) pairs, once per string."""
+    pairs = []
+    for part in cookie_str.split(";"):
+        if "=" not in part:
+            continue
+        name, val = part.split("=", 1)
+        pairs.append((name.strip(), val.strip()))
+    return tuple(pairs)
+
+
 def apply_cookies_to_context(ctx, url: str):
     """Attach cookies parsed from COOKIE_STR to the context for the given domain."""
     if not COOKIE_STR or not ctx:
@@ -151,22 +190,26 @@ def apply_cookies_to_context(ctx, url: str):
         domain = "." + urlparse(url).hostname.split(":", 1)[0]
     except Exception:
         return
-    cookies = []
-    for part in COOKIE_STR.split(";"):
-        if "=" not in part:
-            continue
-        name, val = part.split("=", 1)
-        cookies.append(
-            {
-                "name": name.strip(),
-                "value": val.strip(),
-                "domain": domain,
-                "path": "/",
-            }
-        )
+    # Remember applied domains on the context itself, so a relaunched
+    # browser starts fresh
+    applied = getattr(ctx, "_cookie_domains", None)
+    if applied is None:
+        applied = ctx._cookie_domains = set()
+    if domain in applied:
+        return
+    cookies = [
+        {
+            "name": name,
+            "value": val,
+            "domain": domain,
+            "path": "/",
+        }
+        for name, val in _cookie_pairs(COOKIE_STR)
+    ]
     if cookies:
         try:
             ctx.add_cookies(cookies)
+            applied.add(domain)
         except Exception:
             pass
 
@@ -294,18 +337,31 @@ def fetch_html_undetected(url: str, headless: bool = True, proxy: Optional[str]
     return browser_fetch(url, headless=headless, proxy=proxy, captcha_pause=captcha_pause, wait_selectors=wait_selectors, timeout_ms=timeout_ms)
 
 
+OVERALL_GRADE_RE = re.compile(r"\b([A-F][+-]?)\b\s*Overall\s+Grade")
+GRADE_BADGE_RE = re.compile(r"^[A-F][+-]?$")
+
+
+@lru_cache(maxsize=None)
+def _grade_re(label: str) -> re.Pattern:
+    """Compiled '<label> <grade>' pattern, built once per label."""
+    return re.compile(rf"{label}\s*([A-F][+-]?)", re.IGNORECASE)
+
+
 def extract_grade(text: str, label: str) -> str:
-    m = re.search(rf"{label}\s*([A-F][+-]?)", text, re.IGNORECASE)
+    m = _grade_re(label).search(text)
     return m.group(1).upper() if m else ""
 
 
-def extract_overall_grade(soup: BeautifulSoup) -> str:
+def extract_overall_grade(soup: BeautifulSoup, text: Optional[str] = None) -> str:
     # Niche shows letter grade prominently; capture first standalone grade token.
-    m = re.search(r"\b([A-F][+-]?)\b\s*Overall\s+Grade", soup.get_text(" ", strip=True))
+    # Pass the page's get_text(" ", strip=True) as text if it is already built.
+    if text is None:
+        text = soup.get_text(" ", strip=True)
+    m = OVERALL_GRADE_RE.search(text)
     if m:
         return m.group(1)
     # fallback: first grade badge in page
-    badge = soup.find(string=re.compile(r"^[A-F][+-]?$"))
+    badge = soup.find(string=GRADE_BADGE_RE)
     return badge.strip() if badge else ""
 
 
@@ -318,6 +374,18 @@ def extract_summary(soup: BeautifulSoup) -> str:
     return p.get_text(strip=True) if p else ""
 
 
+# Review bodies, then plain paragraphs as a fallback. iselect yields matches
+# lazily, so the walk stops once two non-empty bodies are found instead of
+# collecting every match on the page first.
+REVIEW_BODY_MATCHER = soupsieve.compile('[itemprop="reviewBody" s]')
+PARAGRAPH_MATCHER = soupsieve.compile("p")
+
+
+def _first_texts(soup: BeautifulSoup, matcher, count: int) -> list[str]:
+    texts = (tag.get_text(" ", strip=True) for tag in matcher.iselect(soup))
+    return list(islice(filter(None, texts), count))
+
+
 def extract_reviews(
     slug: str,
     headless: bool = True,
@@ -356,25 +424,13 @@ def extract_reviews(
     if not html:
         return "", ""
 
-    soup = BeautifulSoup(html, "html.parser")
-    bodies: list[str] = []
-
+    soup = BeautifulSoup(html, HTML_PARSER)
     # Try structured review bodies
-    for tag in soup.find_all(attrs={"itemprop": "reviewBody"}):
-        txt = tag.get_text(" ", strip=True)
-        if txt:
-            bodies.append(txt)
-        if len(bodies) >= 2:
-            break
+    bodies = _first_texts(soup, REVIEW_BODY_MATCHER, 2)
 
     # Fallback to generic paragraphs if nothing found
     if not bodies:
-        for p in soup.find_all("p"):
-            txt = p.get_text(" ", strip=True)
-            if txt:
-                bodies.append(txt)
-            if len(bodies) >= 2:
-                break
+        bodies = _first_texts(soup, PARAGRAPH_MATCHER, 2)
 
     pos = bodies[0] if bodies else ""
     neg = bodies[1] if len(bodies) > 1 else ""
@@ -383,6 +439,51 @@ def extract_reviews(
 
 # ------------------------- Niche enrichment helpers -------------------------
 
+# JSON-LD <script> blocks, compiled once for every Niche page parsed
+# (the "s" flag keeps the type match case-sensitive like find_all's attrs).
+JSONLD_SCRIPT_MATCHER = soupsieve.compile('script[type="application/ld+json" s]')
+
+# Patterns run on every school's pages, compiled once at import.
+NEXT_DATA_RE = re.compile(r'id=[\'"]__NEXT_DATA__[\'"][^>]*>(.+?)</script>', flags=re.S | re.IGNORECASE)
+MEDIAN_EARNINGS_RE = re.compile(r"Median earnings 5 years after graduation[^$]*\$(\d[\d,]*)")
+POLITICS_RE = re.compile(
+    r"(very conservative|conservative|moderate|balanced|liberal|very liberal)\s*(\d+)%?",
+    flags=re.IGNORECASE,
+)
+DIVERSITY_GROUPS = (
+    "African American",
+    "Black",
+    "Asian",
+    "Hispanic",
+    "International",
+    "Non-Citizen",
+    "Multiracial",
+    "Native American",
+    "Pacific Islander",
+    "Unknown",
+    "White",
+)
+DIVERSITY_RE = re.compile(r"(" + "|".join(DIVERSITY_GROUPS) + r")\s*(\d+)%", flags=re.IGNORECASE)
+NON_LETTER_RE = re.compile(r"[^a-z]")
+
+
+@lru_cache(maxsize=4)
+def _next_data(html_str: str) -> Optional[dict]:
+    """
+    The page's embedded __NEXT_DATA__ JSON, or None if missing or unparseable.
+    The debug dump and the politics/diversity fallbacks read the same page,
+    so it is parsed once per page; callers must not mutate the result.
+    """
+    m = NEXT_DATA_RE.search(html_str)
+    if not m:
+        return None
+    try:
+        # __NEXT_DATA__ is HTML-escaped inside the script tag
+        return json.loads(html.unescape(m.group(1).strip()))
+    except Exception:
+        return None
+
+
 def extract_jsonld_college_data(soup: BeautifulSoup) -> dict:
     """Best-effort parse of the CollegeOrUniversity JSON-LD block on a Niche page.
 
@@ -390,10 +491,12 @@ def extract_jsonld_college_data(soup: BeautifulSoup) -> dict:
       street, city, state, zip_code, phone, website, rating_value, rating_count.
     """
     info: dict = {}
-    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
+    for script in JSONLD_SCRIPT_MATCHER.select(soup):
         try:
             raw = script.string or script.get_text()
-            if not raw:
+            # Pages carry several JSON-LD blocks; only decode the one that
+            # can hold the type we want.
+            if not raw or "CollegeOrUniversity" not in raw:
                 continue
             data = json.loads(raw)
         except Exception:
@@ -455,7 +558,7 @@ def extract_median_earnings_5y(text: str) -> Optional[int]:
 
     Returns an integer dollar amount or None if not found.
     """
-    m = re.search(r"Median earnings 5 years after graduation[^$]*\$(\d[\d,]*)", text)
+    m = MEDIAN_EARNINGS_RE.search(text)
     if not m:
         return None
     try:
@@ -467,10 +570,10 @@ def extract_median_earnings_5y(text: str) -> Optional[int]:
 def extract_faqs(soup: BeautifulSoup, limit: int = 3) -> list[dict]:
     """Extract a few FAQ question/answer pairs from the FAQPage JSON-LD, if present."""
     faqs: list[dict] = []
-    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
+    for script in JSONLD_SCRIPT_MATCHER.select(soup):
         try:
             raw = script.string or script.get_text()
-            if not raw:
+            if not raw or "FAQPage" not in raw:
                 continue
             data = json.loads(raw)
         except Exception:
@@ -527,24 +630,8 @@ def save_next_data_json_from_html(slug: str, page_tag: str, html_str: str) -> No
     Output path example:
       scripts/niche_html/{slug}_{page_tag}__next_data.json
     """
-    try:
-        m = re.search(
-            r'id=[\'"]__NEXT_DATA__[\'"][^>]*>(.+?)</script>',
-            html_str,
-            flags=re.S | re.IGNORECASE,
-        )
-        if not m:
-            return
-        raw_json = m.group(1).strip()
-        # __NEXT_DATA__ is HTML-escaped inside the script tag
-        try:
-            from html import unescape
-            raw_json = unescape(raw_json)
-        except Exception:
-            pass
-        data = json.loads(raw_json)
-    except Exception:
-        # Debug helper must never crash the main scraper
+    data = _next_data(html_str)
+    if data is None:
         return
 
     try:
@@ -603,105 +690,72 @@ def extract_politics_label(
     if not html:
         return ""
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     text = soup.get_text(" ", strip=True).lower()
-    matches = re.findall(
-        r"(very conservative|conservative|moderate|balanced|liberal|very liberal)\s*(\d+)%?",
-        text,
-        flags=re.IGNORECASE,
-    )
-    if not matches:
-        cache_path = ROOT / "scripts" / "niche_html" / f"{slug}_students.html"
-        if cache_path.exists():
-            alt_html = cache_path.read_text(encoding="utf-8")
-            soup = BeautifulSoup(alt_html, "html.parser")
-            text = soup.get_text(" ", strip=True).lower()
-            matches = re.findall(
-                r"(very conservative|conservative|moderate|balanced|liberal|very liberal)\s*(\d+)%?",
-                text,
-                flags=re.IGNORECASE,
-            )
+    matches = POLITICS_RE.findall(text)
     if not matches:
         # try embedded __NEXT_DATA__ JSON for politics counts
-        m = re.search(
-            r'id=[\'"]__NEXT_DATA__[\'"][^>]*>(.+?)</script>',
-            html,
-            flags=re.S | re.IGNORECASE,
-        )
-        if not m and "alt_html" in locals():
-            m = re.search(
-                r'id=[\'"]__NEXT_DATA__[\'"][^>]*>(.+?)</script>',
-                alt_html,
-                flags=re.S | re.IGNORECASE,
-            )
-        if m:
-            try:
-                from html import unescape
-                raw_json = unescape(m.group(1).strip())
-                data = json.loads(raw_json)
-            except Exception:
-                data = None
-
-            if data is not None:
-                def normalize_key(k: str) -> str:
-                    # lower-case and strip non-letters so e.g. "veryConservative"
-                    # and "very_conservative" both become "veryconservative"
-                    return re.sub(r"[^a-z]", "", k.lower())
-
-                candidate = None
-
-                def search(obj):
-                    nonlocal candidate
-                    if isinstance(obj, dict):
-                        # build a normalized-key view
-                        norm_map = {normalize_key(k): k for k in obj.keys()}
-                        keys_present = set(norm_map.keys())
-
-                        needed = {"veryconservative", "conservative", "moderate", "liberal", "veryliberal"}
-                        if needed.issubset(keys_present):
-                            # we found an object that has all the buckets we care about
-                            cand = {}
-                            for norm_label, out_label in [
-                                ("veryconservative", "very conservative"),
-                                ("conservative", "conservative"),
-                                ("moderate", "moderate"),
-                                ("liberal", "liberal"),
-                                ("veryliberal", "very liberal"),
-                            ]:
-                                key = norm_map.get(norm_label)
-                                if key is not None:
-                                    try:
-                                        val = obj[key]
-                                        if isinstance(val, (int, float, str)):
-                                            cand[out_label] = float(str(val))
-                                    except Exception:
-                                        continue
-                            # balanced is optional
-                            bal_key = norm_map.get("balanced")
-                            if bal_key is not None:
+        data = _next_data(html)
+        if data is not None:
+            def normalize_key(k: str) -> str:
+                # lower-case and strip non-letters so e.g. "veryConservative"
+                # and "very_conservative" both become "veryconservative"
+                return NON_LETTER_RE.sub("", k.lower())
+
+            candidate = None
+
+            def search(obj):
+                nonlocal candidate
+                if isinstance(obj, dict):
+                    # build a normalized-key view
+                    norm_map = {normalize_key(k): k for k in obj.keys()}
+                    keys_present = set(norm_map.keys())
+
+                    needed = {"veryconservative", "conservative", "moderate", "liberal", "veryliberal"}
+                    if needed.issubset(keys_present):
+                        # we found an object that has all the buckets we care about
+                        cand = {}
+                        for norm_label, out_label in [
+                            ("veryconservative", "very conservative"),
+                            ("conservative", "conservative"),
+                            ("moderate", "moderate"),
+                            ("liberal", "liberal"),
+                            ("veryliberal", "very liberal"),
+                        ]:
+                            key = norm_map.get(norm_label)
+                            if key is not None:
                                 try:
-                                    val = obj[bal_key]
+                                    val = obj[key]
                                     if isinstance(val, (int, float, str)):
-                                        cand["balanced"] = float(str(val))
+                                        cand[out_label] = float(str(val))
                                 except Exception:
-                                    pass
-                            if cand:
-                                candidate = cand
-                                return
-
-                        for v in obj.values():
-                            if candidate is not None:
-                                return
-                            search(v)
-                    elif isinstance(obj, list):
-                        for v in obj:
-                            if candidate is not None:
-                                return
-                            search(v)
-
-                search(data)
-                if candidate:
-                    matches = [(k, str(v)) for k, v in candidate.items() if v is not None]
+                                    continue
+                        # balanced is optional
+                        bal_key = norm_map.get("balanced")
+                        if bal_key is not None:
+                            try:
+                                val = obj[bal_key]
+                                if isinstance(val, (int, float, str)):
+                                    cand["balanced"] = float(str(val))
+                            except Exception:
+                                pass
+                        if cand:
+                            candidate = cand
+                            return
+
+                    for v in obj.values():
+                        if candidate is not None:
+                            return
+                        search(v)
+                elif isinstance(obj, list):
+                    for v in obj:
+                        if candidate is not None:
+                            return
+                        search(v)
+
+            search(data)
+            if candidate:
+                matches = [(k, str(v)) for k, v in candidate.items() if v is not None]
     if not matches:
         return ""
 
@@ -755,92 +809,66 @@ def extract_diversity(
     if not html:
         return None, None, None
 
-    groups = [
-        "African American",
-        "Black",
-        "Asian",
-        "Hispanic",
-        "International",
-        "Non-Citizen",
-        "Multiracial",
-        "Native American",
-        "Pacific Islander",
-        "Unknown",
-        "White",
-    ]
-    pattern = r"(" + "|".join(groups) + r")\s*(\d+)%"
-    matches = re.findall(pattern, html, flags=re.IGNORECASE)
+    matches = DIVERSITY_RE.findall(html)
     if not matches:
         # try text-stripped version
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
         text = soup.get_text(" ", strip=True)
-        matches = re.findall(pattern, text, flags=re.IGNORECASE)
+        matches = DIVERSITY_RE.findall(text)
     if not matches:
         # try embedded __NEXT_DATA__ JSON for race/ethnicity breakdown
-        m = re.search(
-            r'id=[\'"]__NEXT_DATA__[\'"][^>]*>(.+?)</script>',
-            html,
-            flags=re.S | re.IGNORECASE,
-        )
-        if m:
-            try:
-                from html import unescape
-                raw_json = unescape(m.group(1).strip())
-                data = json.loads(raw_json)
-            except Exception:
-                data = None
-
-            if data is not None:
-                race_candidate = None
-
-                def search(obj):
-                    nonlocal race_candidate
-                    if isinstance(obj, dict):
-                        # look for an object that appears to be race counts/percentages
-                        keys = [k.lower() for k in obj.keys()]
-                        # require at least two common race keys to avoid false positives
-                        race_keys = {"white", "black", "african", "hispanic", "asian", "international", "non-citizen"}
-                        if len(race_keys.intersection(set(keys))) >= 2:
-                            tmp = {}
-                            for k, v in obj.items():
-                                k_norm = k.lower()
-                                try:
-                                    val = float(str(v))
-                                except Exception:
-                                    continue
-                                tmp[k_norm] = val
-                            if tmp:
-                                race_candidate = tmp
-                                return
-                        for v in obj.values():
-                            if race_candidate is not None:
-                                return
-                            search(v)
-                    elif isinstance(obj, list):
-                        for v in obj:
-                            if race_candidate is not None:
-                                return
-                            search(v)
-
-                search(data)
-                if race_candidate:
-                    matches = []
-                    for k_norm, val in race_candidate.items():
-                        # only keep sane 0–100 values
-                        if not (0 <= val <= 100):
-                            continue
-                        label = k_norm
-                        if "black" in label or "african" in label:
-                            label = "African American"
-                        elif "non-citizen" in label or "international" in label or "noncitizen" in label:
-                            label = "International"
-                        elif "white" in label:
-                            label = "White"
-                        elif "asian" in label:
-                            label = "Asian"
-                        elif "hispanic" in label or "latino" in label:
-                            label = "Hispanic"
-                        matches.append((label, str(val)))
+        data = _next_data(html)
+        if data is not None:
+            race_candidate = None
+
+            def search(obj):
+                nonlocal race_candidate
+                if isinstance(obj, dict):
+                    # look for an object that appears to be race counts/percentages
+                    keys = [k.lower() for k in obj.keys()]
+                    # require at least two common race keys to avoid false positives
+                    race_keys = {"white", "black", "african", "hispanic", "asian", "international", "non-citizen"}
+                    if len(race_keys.intersection(set(keys))) >= 2:
+                        tmp = {}
+                        for k, v in obj.items():
+                            k_norm = k.lower()
+                            try:
+                                val = float(str(v))
+                            except Exception:
+                                continue
+                            tmp[k_norm] = val
+                        if tmp:
+                            race_candidate = tmp
+                            return
+                    for v in obj.values():
+                        if race_candidate is not None:
+                            return
+                        search(v)
+                elif isinstance(obj, list):
+                    for v in obj:
+                        if race_candidate is not None:
+                            return
+                        search(v)
+
+            search(data)
+            if race_candidate:
+                matches = []
+                for k_norm, val in race_candidate.items():
+                    # only keep sane 0–100 values
+                    if not (0 <= val <= 100):
+                        continue
+                    label = k_norm
+                    if "black" in label or "african" in label:
+                        label = "African American"
+                    elif "non-citizen" in label or "international" in label or "noncitizen" in label:
+                        label = "International"
+                    elif "white" in label:
+                        label = "White"
+                    elif "asian" in label:
+                        label = "Asian"
+                    elif "hispanic" in label or "latino" in label:
+                        label = "Hispanic"
+                    matches.append((label, str(val)))
 
     if not matches:
         return None, None, None
@@ -898,13 +926,13 @@ def update_team(team: dict, headless: bool = True, proxy: Optional[str] = None,
     if not html:
         return "no_html"
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     text = soup.get_text(" ", strip=True)
 
     niche = team.get("niche", {}) or {}
     before = niche.copy()
 
-    niche["overall_grade"] = extract_overall_grade(soup) or niche.get("overall_grade", "")
+    niche["overall_grade"] = extract_overall_grade(soup, text) or niche.get("overall_grade", "")
     niche["academics_grade"] = extract_grade(text, "Academics") or niche.get("academics_grade", "")
     niche["value_grade"] = extract_grade(text, "Value") or niche.get("value_grade", "")
     niche["summary"] = extract_summary(soup) or niche.get("summary", "")
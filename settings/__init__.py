@@ -6,16 +6,12 @@ from scripts.helpers.teams_loader import load_teams
 from scripts.helpers.transfers_loader import load_transfers
 from scripts.helpers.incoming_players_data import RAW_INCOMING_TEXT, get_raw_incoming_text
 
-TEAMS = load_teams()
-OUTGOING_TRANSFERS = load_transfers()
-
-
 def _build_rpi_aliases():
     """
     Build a mapping of alias -> canonical team name using teams.json data.
     """
     aliases = {}
-    for team in TEAMS:
+    for team in load_teams():
         canonical = team.get("team") or ""
         if not canonical:
             continue
@@ -35,6 +31,21 @@ def _build_rpi_aliases():
     return aliases
 
 
-RPI_TEAM_NAME_ALIASES = _build_rpi_aliases()
+# TEAMS, OUTGOING_TRANSFERS and RPI_TEAM_NAME_ALIASES read the JSON settings
+# files, so they are built on first access (PEP 562) rather than at import.
+_LAZY_ATTRS = {
+    "TEAMS": load_teams,
+    "OUTGOING_TRANSFERS": load_transfers,
+    "RPI_TEAM_NAME_ALIASES": _build_rpi_aliases,
+}
+
+
+def __getattr__(name):
+    loader = _LAZY_ATTRS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = loader()
+    return value
+
 
 __all__ = ["TEAMS", "OUTGOING_TRANSFERS", "RPI_TEAM_NAME_ALIASES", "RAW_INCOMING_TEXT"]
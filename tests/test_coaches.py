@@ -0,0 +1,19 @@
+from scripts.helpers import coaches
+
+
+def test_ordinal_to_int_accepts_words_digits_and_suffixes():
+    assert coaches._ordinal_to_int("third") == 3
+    assert coaches._ordinal_to_int(" Fifteenth ") == 15
+    assert coaches._ordinal_to_int("3rd") == 3
+    assert coaches._ordinal_to_int("03") == 3
+    assert coaches._ordinal_to_int("49th") == 49
+    assert coaches._ordinal_to_int("50") is None
+    assert coaches._ordinal_to_int("0") is None
+    assert coaches._ordinal_to_int("") is None
+
+
+def test_extract_tenure_from_text():
+    assert coaches.extract_tenure_from_text("She enters her third season", 2025) == (2023, 3)
+    assert coaches.extract_tenure_from_text("is in his 6th year", 2025) == (2020, 6)
+    assert coaches.extract_tenure_from_text("Hired in 2019 as head coach", 2025) == (2019, 7)
+    assert coaches.extract_tenure_from_text("No tenure details", 2025) == (None, None)
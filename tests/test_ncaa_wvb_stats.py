@@ -0,0 +1,43 @@
+import pytest
+
+from scripts import ncaa_wvb_stats_2025 as stats
+
+pytest.importorskip("selectolax.lexbor")
+pytest.importorskip("bs4")
+
+
+PAGE = """<html><head><script>var x = '<table><tr><td>no</td></tr></table>';</script></head><body>
+<table id="rosters_form_players_0"><thead><tr><th>#</th><th>Name</th></tr></thead><tbody></tbody></table>
+<table id="rosters_form_players_7">
+<thead><tr><th>#</th><th>Name</th><th>Class</th><th>Position</th></tr></thead>
+<tbody>
+<tr><td> 3 </td><td><a href="/players/333/">Zoe  O'Neil</a></td><td>Fr</td><td>MB</td></tr>
+<tr><td>4</td><td>No Link</td><td>So</td><td>DS<style>td{}</style></td></tr>
+</tbody></table>
+</body></html>"""
+
+STATS_PAGE = """<html><body><table id="stat_grid">
+<tr><th>#</th><th>Player</th><th>Kills</th></tr>
+<tr><td>1</td><td><a href="/players/111">Jane Doe</a></td><td>250</td></tr>
+<tr><td>2</td><td>Team</td><td><a href="/teams/9">40</a></td></tr>
+</table></body></html>"""
+
+
+def test_roster_rows_match_across_backends():
+    lexbor = stats._roster_rows(PAGE, stats._LexborTables)
+    bs4 = stats._roster_rows(PAGE, stats._Bs4Tables)
+    assert lexbor == bs4
+    headers, name_idx, rows = lexbor
+    assert headers == ["#", "Name", "Class", "Position"]
+    assert name_idx == 1
+    assert rows[0] == ["3", "333", "Zoe  O'Neil", "Fr", "MB"]
+    assert rows[1] == ["4", None, "No Link", "So", "DS"]
+
+
+def test_stats_rows_match_across_backends():
+    lexbor = stats._stats_rows(STATS_PAGE, stats._LexborTables)
+    bs4 = stats._stats_rows(STATS_PAGE, stats._Bs4Tables)
+    assert lexbor == bs4
+    headers, rows = lexbor
+    assert headers == ["#", "Player", "Kills"]
+    assert rows == [["1", "111", "Jane Doe", "250"], ["2", "Team", "40"]]